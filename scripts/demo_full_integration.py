@@ -9,6 +9,7 @@ import sys
 import time
 import json
 import logging
+import array
 import numpy as np
 from datetime import datetime
 from pathlib import Path
@@ -35,7 +36,14 @@ except ImportError:
     PSUTIL_AVAILABLE = False
     psutil = None
 
-import yaml
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
+    bn = None
+
+from config_loader import load_config
 
 
 from llm.ollama_client import OllamaClient
@@ -54,12 +62,31 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+if BOTTLENECK_AVAILABLE:
+    _nanmin, _nanmax, _nanmean = bn.nanmin, bn.nanmax, bn.nanmean
+else:
+    _nanmin, _nanmax, _nanmean = np.nanmin, np.nanmax, np.nanmean
+
+
+COMPONENT_ORDER = (
+    'stt_total',
+    'memory_context_retrieval',
+    'llm_total',
+    'llm_time_to_first_token',
+    'tts_total',
+    'expression_update',
+    'memory_save_message'
+)
+
+
 class LatencyMonitor:
     """
     Monitors and tracks latency metrics for all components
     """
+    __slots__ = ('metrics', 'current_timers')
+
     def __init__(self):
-        self.metrics = defaultdict(list)
+        self.metrics = defaultdict(lambda: array.array('d'))
         self.current_timers = {}
 
     def start_timer(self, metric_name: str):
@@ -100,12 +127,14 @@ class LatencyMonitor:
             if not values:
                 continue
 
-            values_array = np.array(values)
+            # Zero-copy view over the metric's double buffer
+            values_array = np.frombuffer(values, dtype=np.float64)
+            k = int(0.95 * (len(values_array) - 1))
             stats[metric_name] = {
-                'min': float(np.min(values_array)),
-                'max': float(np.max(values_array)),
-                'avg': float(np.mean(values_array)),
-                'p95': float(np.percentile(values_array, 95)),
+                'min': float(_nanmin(values_array)),
+                'max': float(_nanmax(values_array)),
+                'avg': float(_nanmean(values_array)),
+                'p95': float(np.partition(values_array, k)[k]),
                 'count': len(values),
                 'total': float(np.sum(values_array))
             }
@@ -157,28 +186,25 @@ class LatencyMonitor:
 
         print(f"{Fore.YELLOW}Component Breakdown:{Style.RESET_ALL}")
 
-        component_order = [
-            'stt_total',
-            'memory_context_retrieval',
-            'llm_total',
-            'llm_time_to_first_token',
-            'tts_total',
-            'expression_update',
-            'memory_save_message'
-        ]
-
-        for component in component_order:
-            if component in stats:
-                c = stats[component]
+
+        components = {}
+        tts_segments = []
+        for name, s in stats.items():
+            if name in COMPONENT_ORDER:
+                components[name] = s
+            elif name.startswith('tts_segment_'):
+                tts_segments.append((name, s))
+
+        for component in COMPONENT_ORDER:
+            c = components.get(component)
+            if c is not None:
                 print(f"  {component:30s}: {c['avg']:6.3f}s "
                       f"(min: {c['min']:.3f}s, max: {c['max']:.3f}s)")
 
 
-        tts_segments = [k for k in stats.keys() if k.startswith('tts_segment_')]
         if tts_segments:
             print(f"\n{Fore.YELLOW}TTS Segments:{Style.RESET_ALL}")
-            for seg in sorted(tts_segments):
-                s = stats[seg]
+            for seg, s in sorted(tts_segments):
                 print(f"  {seg}: {s['avg']:.3f}s")
 
         print(f"\n{Fore.CYAN}{'─'*70}{Style.RESET_ALL}\n")
@@ -309,6 +335,13 @@ class IntegrationTest:
     Main integration test orchestrator
     Tests all components with comprehensive latency monitoring
     """
+    __slots__ = (
+        'config', 'latency_monitor', 'resource_monitor', 'session_id',
+        'user_id', 'user_memory', 'conversation_history', 'ollama_client',
+        'conversation_manager', 'tts_engine', 'stt_engine', 'emotion_display',
+        'voice_pipeline', 'stt_mute_until', 'gesture_tts_mute_secs',
+        'petting_lock', 'input_mode', 'shutdown_requested'
+    )
 
     def __init__(self, config: dict):
         """
@@ -620,17 +653,19 @@ class IntegrationTest:
             user_text: User's input text
         """
         turn_start = time.time()
+        start_timer = self.latency_monitor.start_timer
+        end_timer = self.latency_monitor.end_timer
+        record_metric = self.latency_monitor.record_metric
 
-
-        self.latency_monitor.start_timer('memory_context_retrieval')
+        start_timer('memory_context_retrieval')
         context = self.conversation_history.get_recent_context(
             self.user_id, limit=10
         )
-        self.latency_monitor.end_timer('memory_context_retrieval')
+        end_timer('memory_context_retrieval')
 
 
-        self.latency_monitor.start_timer('llm_total')
-        self.latency_monitor.start_timer('llm_time_to_first_token')
+        start_timer('llm_total')
+        start_timer('llm_time_to_first_token')
 
         segments = []
         first_token_recorded = False
@@ -643,7 +678,7 @@ class IntegrationTest:
                 user_text, self.user_id
             ):
                 if not first_token_recorded:
-                    ttft = self.latency_monitor.end_timer('llm_time_to_first_token')
+                    ttft = end_timer('llm_time_to_first_token')
                     logger.debug(f"Time to first token: {ttft:.3f}s")
                     first_token_recorded = True
 
@@ -654,14 +689,14 @@ class IntegrationTest:
                 if not tts_started:
                     tts_started = True
                     tts_start = time.time()
-                    self.latency_monitor.start_timer('tts_total')
+                    start_timer('tts_total')
                 seg_idx = len(segments) - 1
-                self.latency_monitor.start_timer(f'tts_segment_{seg_idx}')
+                start_timer(f'tts_segment_{seg_idx}')
 
                 if self.emotion_display:
-                    self.latency_monitor.start_timer('expression_update')
+                    start_timer('expression_update')
                     self.emotion_display.set_emotion(emotion, transition_duration=0.3)
-                    self.latency_monitor.end_timer('expression_update')
+                    end_timer('expression_update')
                     self.emotion_display.set_speaking(True)
 
                 try:
@@ -672,7 +707,7 @@ class IntegrationTest:
                 if self.emotion_display:
                     self.emotion_display.set_speaking(False)
 
-                self.latency_monitor.end_timer(f'tts_segment_{seg_idx}')
+                end_timer(f'tts_segment_{seg_idx}')
 
         except Exception as e:
             logger.error(f"LLM generation error: {e}", exc_info=True)
@@ -682,7 +717,7 @@ class IntegrationTest:
 
         print()
 
-        llm_duration = self.latency_monitor.end_timer('llm_total')
+        llm_duration = end_timer('llm_total')
         self.resource_monitor.capture_snapshot('llm')
 
 
@@ -691,10 +726,10 @@ class IntegrationTest:
 
             estimated_tokens = len(response_text) / 4
             tokens_per_second = estimated_tokens / llm_duration
-            self.latency_monitor.record_metric('tokens_per_second', tokens_per_second)
+            record_metric('tokens_per_second', tokens_per_second)
 
 
-        self.latency_monitor.start_timer('memory_save_message')
+        start_timer('memory_save_message')
 
 
         self.conversation_history.save_message(
@@ -710,11 +745,11 @@ class IntegrationTest:
                 response_text, emotion=final_emotion
             )
 
-        self.latency_monitor.end_timer('memory_save_message')
+        end_timer('memory_save_message')
 
 
         if first_token_recorded and tts_started:
-            self.latency_monitor.end_timer('tts_total')
+            end_timer('tts_total')
             self.resource_monitor.capture_snapshot('tts')
         elif not tts_started:
 
@@ -723,12 +758,12 @@ class IntegrationTest:
 
         turn_end = time.time()
         end_to_end = turn_end - turn_start
-        self.latency_monitor.record_metric('end_to_end_latency', end_to_end)
+        record_metric('end_to_end_latency', end_to_end)
 
 
         if first_token_recorded and tts_started:
             perceived = tts_start - turn_start
-            self.latency_monitor.record_metric('perceived_latency', perceived)
+            record_metric('perceived_latency', perceived)
 
 
         self.resource_monitor.capture_snapshot('turn_end')
@@ -907,8 +942,7 @@ def main():
         return 1
 
     try:
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+        config = load_config(config_path)
     except Exception as e:
         print(f"Error loading config: {e}")
         return 1
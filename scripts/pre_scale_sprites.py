@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Sprite Pre-Scaler
+Writes display-resolution copies of the emotion sprites so startup skips smoothscale
+"""
+
+import argparse
+import glob
+import os
+import sys
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+from config_loader import load_config
+from expression.display_renderer import scaled_variant_path
+
+
+def pre_scale(image_dir: Path, screen_size) -> int:
+    """
+    Write '<stem>_<W>x<H>.png' next to every sprite whose size differs
+
+    Args:
+        image_dir: Directory containing emotion sprite images
+        screen_size: Display resolution (width, height)
+
+    Returns:
+        Number of files written
+    """
+    written = 0
+    suffix = "_{}x{}".format(*screen_size)
+
+    for image_path in sorted(glob.glob(str(image_dir / "*.png"))):
+        if Path(image_path).stem.endswith(suffix):
+            continue
+
+        surface = pygame.image.load(image_path)
+        if surface.get_size() == tuple(screen_size):
+            continue
+
+        out_path = scaled_variant_path(image_path, screen_size)
+        pygame.image.save(pygame.transform.smoothscale(surface, screen_size), str(out_path))
+        print(f"  {Path(image_path).name} -> {out_path.name}")
+        written += 1
+
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-scale emotion sprites to the display resolution")
+    parser.add_argument(
+        '--config',
+        default=str(PROJECT_ROOT / 'config' / 'settings.yaml'),
+        help="Path to settings.yaml"
+    )
+    args = parser.parse_args()
+
+    display_config = load_config(args.config).get('expression', {}).get('display', {})
+    screen_size = tuple(display_config.get('resolution', [320, 240]))
+    image_dir = PROJECT_ROOT / display_config.get('image_dir', 'src/display')
+
+    if not image_dir.exists():
+        print(f"Image directory not found: {image_dir}")
+        return 1
+
+    pygame.init()
+    written = pre_scale(image_dir, screen_size)
+    pygame.quit()
+
+    print(f"Wrote {written} sprite(s) at {screen_size[0]}x{screen_size[1]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
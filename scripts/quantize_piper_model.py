@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Piper Model Quantizer
+Converts the configured Piper voice to INT8 weights with ONNX Runtime
+"""
+
+import argparse
+import shutil
+import sys
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from config_loader import load_config
+
+try:
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+
+def quantize_model(model_path: Path) -> Path:
+    """
+    Write an INT8 copy of a Piper voice next to the original
+
+    Piper looks for '<model>.json' beside the model, so the voice config is
+    copied along with it.
+
+    Args:
+        model_path: FP32 Piper .onnx model
+
+    Returns:
+        Path to the quantized model
+    """
+    out_path = model_path.with_suffix('.int8.onnx')
+
+    quantize_dynamic(str(model_path), str(out_path), weight_type=QuantType.QInt8)
+
+    config_path = Path(str(model_path) + '.json')
+    if config_path.exists():
+        shutil.copyfile(config_path, str(out_path) + '.json')
+
+    return out_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Quantize the Piper voice model to INT8")
+    parser.add_argument('--model', help="Model to quantize (defaults to speech.tts.piper.model_path)")
+    parser.add_argument(
+        '--config',
+        default=str(Path(__file__).parent.parent / 'config' / 'settings.yaml'),
+        help="Path to settings.yaml"
+    )
+    args = parser.parse_args()
+
+    if not ONNXRUNTIME_AVAILABLE:
+        print("onnxruntime is not installed (pip install onnxruntime)")
+        return 1
+
+    model_path = Path(args.model or load_config(args.config)['speech']['tts']['piper']['model_path'])
+    if not model_path.exists():
+        print(f"Model not found: {model_path}")
+        return 1
+
+    out_path = quantize_model(model_path)
+
+    size_in = model_path.stat().st_size / 1e6
+    size_out = out_path.stat().st_size / 1e6
+    print(f"Wrote {out_path} ({size_in:.1f} MB -> {size_out:.1f} MB)")
+    print("Listen to a few phrases before switching speech.tts.piper.model_path to it.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,12 +9,31 @@ import wave
 import threading
 import queue
 import logging
-from typing import Optional, Callable
+from typing import Optional, Callable, Union
 import webrtcvad
 
+from .ring_buffer import SPSCRing
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _abs_sum_jit(samples):
+        """Sum of absolute int16 samples in one compiled pass"""
+        total = 0
+        for v in samples:
+            total += abs(np.int64(v))
+        return total
+
+
 class AudioInput:
     """Handles audio input from mini microphone with voice activity detection"""
 
@@ -35,22 +54,65 @@ class AudioInput:
 
         self.pyaudio = pyaudio.PyAudio()
         self.stream: Optional[pyaudio.Stream] = None
+        self._sample_width = self.pyaudio.get_sample_size(pyaudio.paInt16)
 
-        self.audio_queue = queue.Queue(maxsize=100)
+        self.audio_queue = SPSCRing(100)
 
         self.level_queue = queue.Queue(maxsize=1)
 
         self.is_recording = False
         self.is_listening = False
         self.record_thread: Optional[threading.Thread] = None
+        self._rec_gen = 0
+
+
+        # Recording buffer reused across recordings; only its fill length is
+        # reset, so it keeps the capacity of the longest utterance so far
+        self._rec_buf = bytearray()
+        self._rec_len = 0
 
 
         self._callback_count = 0
         self._last_callback_log = 0
+        self._last_level = 0.0
 
 
         self.vad = webrtcvad.Vad(self.vad_config['vad_aggressiveness'])
 
+
+        self._vad_frame_size = int(self.sample_rate * 30 / 1000)
+        self._vad_scratch = np.zeros(self._vad_frame_size, dtype=np.int16)
+        self._vad_scratch_fill = 0
+
+
+        # webrtcvad reads any contiguous buffer, so hand it a byte view of
+        # the scratch array rather than a fresh bytes copy per frame; fall
+        # back to tobytes() on builds that only accept bytes
+        self._vad_frame = memoryview(self._vad_scratch).cast('B')
+        try:
+            self.vad.is_speech(self._vad_frame, self.sample_rate)
+        except TypeError:
+            logger.debug("webrtcvad needs bytes input, copying VAD frames")
+            self._vad_frame = None
+        except Exception as e:
+            logger.debug(f"VAD probe failed: {e}")
+
+        # Optional energy + zero-crossing VAD; its energy floor is raised from
+        # the first 500 ms of ambient audio after start_listening()
+        self.vad_engine = self.vad_config.get('vad_engine', 'webrtc')
+        self._energy_thr = self.vad_config['silence_threshold'] ** 2
+        self._zcr_max = int(0.35 * self._vad_frame_size)
+        self._calibration_chunks = max(1, int(0.5 * self.sample_rate / self.chunk_size))
+        self._calib_remaining = 0
+        self._calib_energy = 0
+        self._calib_samples = 0
+
+        self._last_was_speech = False
+        self._silence_threshold_sums = {
+            self.chunk_size: self.vad_config['silence_threshold'] * self.chunk_size
+        }
+        self._detect_voice = self._build_voice_detector()
+
         self._initialize_audio_device()
 
     def _initialize_audio_device(self):
@@ -106,6 +168,10 @@ class AudioInput:
                 stream_callback=self._audio_callback
             )
 
+            self._calib_remaining = self._calibration_chunks if self.vad_engine == 'energy' else 0
+            self._calib_energy = 0
+            self._calib_samples = 0
+
             self.is_listening = True
             self.stream.start_stream()
 
@@ -164,11 +230,17 @@ class AudioInput:
 
 
         if self.is_recording:
-            try:
-                self.audio_queue.put_nowait(in_data)
-            except queue.Full:
+            if not self.audio_queue.push((self._rec_gen, in_data)):
                 logger.warning("Audio queue full, dropping frame")
 
+
+        # Strided peak for the level meter, so readers never touch the queues
+        samples = memoryview(in_data).cast('h')
+        self._last_level = max(map(abs, samples[::32]), default=0) / 32768.0
+
+        if self._calib_remaining:
+            self._calibrate_energy(in_data)
+
         return (None, pyaudio.paContinue)
 
     def start_recording(self) -> threading.Thread:
@@ -182,8 +254,17 @@ class AudioInput:
             logger.warning("Already recording")
             return self.record_thread
 
+        # A recorder that stopped itself on silence may still be exiting;
+        # the ring only supports one consumer at a time
+        if self.record_thread is not None:
+            self.record_thread.join(timeout=2.0)
+
+        # Rather than clearing the ring under the producer's feet, bump the
+        # generation so chunks left over from the last recording are skipped
+        self._rec_gen += 1
+        self._last_was_speech = False
+        self._rec_len = 0
         self.is_recording = True
-        self.audio_queue.queue.clear()
 
         self.record_thread = threading.Thread(target=self._record_with_vad)
         self.record_thread.start()
@@ -198,24 +279,28 @@ class AudioInput:
         Returns:
             Raw audio bytes
         """
-        if not self.is_recording:
+        if self.record_thread is None:
             return b''
 
         self.is_recording = False
+        self.audio_queue.interrupt()
 
-        if self.record_thread:
-            self.record_thread.join(timeout=2.0)
+        self.record_thread.join(timeout=2.0)
+        self.record_thread = None
 
 
-        audio_data = []
-        while not self.audio_queue.empty():
-            try:
-                audio_data.append(self.audio_queue.get_nowait())
-            except queue.Empty:
-                break
+        for gen, audio_chunk in self.audio_queue.drain():
+            if gen == self._rec_gen:
+                self._append_recording(audio_chunk)
+
+        logger.info(f"Recording stopped, collected {self._rec_len} bytes")
+        return bytes(memoryview(self._rec_buf)[:self._rec_len])
 
-        logger.info(f"Recording stopped, collected {len(audio_data)} chunks")
-        return b''.join(audio_data)
+    def _append_recording(self, audio_chunk: bytes):
+        """Copy a chunk into the reusable recording buffer"""
+        end = self._rec_len + len(audio_chunk)
+        self._rec_buf[self._rec_len:end] = audio_chunk
+        self._rec_len = end
 
     def _record_with_vad(self):
         """Record audio with voice activity detection"""
@@ -225,10 +310,15 @@ class AudioInput:
         )
 
         while self.is_recording:
-            try:
 
-                audio_chunk = self.audio_queue.get(timeout=0.1)
+            if not self.audio_queue.wait(timeout=0.5):
+                continue
 
+            for gen, audio_chunk in self.audio_queue.drain():
+                if gen != self._rec_gen:
+                    continue
+
+                self._append_recording(audio_chunk)
 
                 is_speech = self._detect_voice(audio_chunk)
 
@@ -241,61 +331,143 @@ class AudioInput:
                 else:
                     silence_frames = 0
 
-            except queue.Empty:
-                continue
+    def _calibrate_energy(self, audio_chunk: bytes):
+        """
+        Accumulate ambient energy for the energy VAD's threshold
 
-    def _detect_voice(self, audio_chunk: bytes) -> bool:
+        Args:
+            audio_chunk: Raw audio bytes captured right after start_listening()
         """
-        Detect if audio chunk contains voice
+        audio_array = np.frombuffer(audio_chunk, dtype=np.int16)
+        self._calib_energy += int(np.square(audio_array, dtype=np.int32).sum(dtype=np.int64))
+        self._calib_samples += len(audio_array)
+        self._calib_remaining -= 1
+
+        if not self._calib_remaining and self._calib_samples:
+
+            # Speech has to sit ~6 dB above the room; never go below the
+            # configured silence threshold
+            ambient = self._calib_energy // self._calib_samples
+            self._energy_thr = max(self.vad_config['silence_threshold'] ** 2, 4 * ambient)
+            logger.info(f"Energy VAD calibrated: ambient={ambient}, threshold={self._energy_thr}")
+
+    def _simple_vad(self, audio_array: np.ndarray) -> bool:
+        """
+        Energy + zero-crossing-rate voice check for one frame
+
+        Voiced speech is loud relative to the room and crosses zero far less
+        often than hiss or fan noise.
 
         Args:
-            audio_chunk: Raw audio bytes
+            audio_array: int16 samples of one VAD frame
 
         Returns:
-            True if voice detected, False otherwise
+            True if the frame looks like speech
         """
+        energy = int(np.square(audio_array, dtype=np.int32).sum(dtype=np.int64))
+        zcr = int(np.count_nonzero(np.diff(np.signbit(audio_array))))
+        return energy > self._energy_thr * len(audio_array) and zcr < self._zcr_max
 
-        audio_array = np.frombuffer(audio_chunk, dtype=np.int16)
-
+    def _build_voice_detector(self) -> Callable[[bytes], bool]:
+        """
+        Build the per-chunk voice detector specialized for this config
 
-        amplitude = np.abs(audio_array).mean()
-        if amplitude < self.vad_config['silence_threshold']:
-            return False
+        The threshold, VAD handle, sample rate and scratch buffers never
+        change after __init__, so they are bound into a closure once instead
+        of being looked up on every chunk.
 
+        Returns:
+            Function taking raw audio bytes and returning True if voice detected
+        """
+        threshold = self.vad_config['silence_threshold']
+        gates_enabled = threshold > 0
+        is_speech_fn = self.vad.is_speech
+        simple_vad = self._simple_vad if self.vad_engine == 'energy' else None
+        sample_rate = self.sample_rate
+        frame_size = self._vad_frame_size
+        scratch = self._vad_scratch
+        frame = self._vad_frame
+        amplitude_sum = self._amplitude_sum
+        threshold_sum = self._threshold_sum
+
+        def detect_voice(audio_chunk: bytes) -> bool:
+
+            # The amplitude gates only pay off between utterances: skip them
+            # when they are disabled or when the previous chunk was speech
+            gated = gates_enabled and not self._last_was_speech
+
+            if gated:
+
+                # Cheap silence rejection: if every 8th sample is below the
+                # threshold, skip building a NumPy array for this chunk at all
+                samples = memoryview(audio_chunk).cast('h')
+                if max(map(abs, samples[::8]), default=0) < threshold:
+                    return False
 
-        try:
+            audio_array = np.frombuffer(audio_chunk, dtype=np.int16)
 
+            if gated:
 
-            frame_duration = 30
-            frame_size = int(self.sample_rate * frame_duration / 1000)
+                # Compare the integer sum against threshold * length instead
+                # of taking a float mean
+                if amplitude_sum(audio_array) < threshold_sum(len(audio_array)):
+                    return False
 
 
-            if len(audio_array) < frame_size:
-                audio_array = np.pad(audio_array, (0, frame_size - len(audio_array)))
-            elif len(audio_array) > frame_size:
-                audio_array = audio_array[:frame_size]
+            try:
 
-            audio_bytes = audio_array.tobytes()
-            return self.vad.is_speech(audio_bytes, self.sample_rate)
+                # Copy one 30 ms frame into the preallocated scratch buffer,
+                # zero-padding only when this chunk is shorter than the last
+                n = min(len(audio_array), frame_size)
+                scratch[:n] = audio_array[:n]
+                if n < self._vad_scratch_fill:
+                    scratch[n:] = 0
+                self._vad_scratch_fill = n
 
-        except Exception as e:
-            logger.debug(f"VAD error, using amplitude only: {e}")
-            return amplitude >= self.vad_config['silence_threshold']
+                if simple_vad is not None:
+                    is_speech = simple_vad(scratch)
+                else:
+                    is_speech = is_speech_fn(frame if frame is not None else scratch.tobytes(), sample_rate)
 
-    def save_audio(self, audio_data: bytes, filename: str):
+            except Exception as e:
+                logger.debug(f"VAD error, using amplitude only: {e}")
+                is_speech = amplitude_sum(audio_array) >= threshold_sum(len(audio_array))
+
+            self._last_was_speech = is_speech
+            return is_speech
+
+        return detect_voice
+
+    @staticmethod
+    def _amplitude_sum(audio_array: np.ndarray) -> int:
+        """Sum of absolute sample values, accumulated in int64"""
+        if NUMBA_AVAILABLE:
+            return int(_abs_sum_jit(audio_array))
+        return int(np.abs(audio_array).sum(dtype=np.int64))
+
+    def _threshold_sum(self, length: int) -> int:
+        """silence_threshold scaled to a chunk of the given length, cached per length"""
+        threshold_sum = self._silence_threshold_sums.get(length)
+        if threshold_sum is None:
+            threshold_sum = self.vad_config['silence_threshold'] * length
+            self._silence_threshold_sums[length] = threshold_sum
+        return threshold_sum
+
+    def save_audio(self, audio_data: Union[bytes, memoryview], filename: str):
         """
         Save audio data to WAV file
 
         Args:
-            audio_data: Raw audio bytes
+            audio_data: Raw audio bytes (any bytes-like object)
             filename: Output filename
         """
         try:
             with wave.open(filename, 'wb') as wf:
                 wf.setnchannels(self.channels)
-                wf.setsampwidth(self.pyaudio.get_sample_size(pyaudio.paInt16))
+                wf.setsampwidth(self._sample_width)
                 wf.setframerate(self.sample_rate)
-                wf.writeframes(audio_data)
+                # The header length is patched once when the file closes
+                wf.writeframesraw(audio_data)
 
             logger.info(f"Audio saved to {filename}")
 
@@ -312,26 +484,7 @@ class AudioInput:
         if not self.is_listening:
             return 0.0
 
-        try:
-
-            if self.level_queue.empty():
-                return 0.0
-
-            audio_chunk = self.level_queue.get_nowait()
-            audio_array = np.frombuffer(audio_chunk, dtype=np.int16)
-            level = np.abs(audio_array).mean() / 32768.0
-
-
-            try:
-                self.level_queue.put_nowait(audio_chunk)
-            except queue.Full:
-                pass
-
-            return min(1.0, level)
-
-        except (queue.Empty, Exception) as e:
-            logger.debug(f"Error getting audio level: {e}")
-            return 0.0
+        return min(1.0, self._last_level)
 
     def cleanup(self):
         """Clean up audio resources"""
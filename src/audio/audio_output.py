@@ -5,18 +5,287 @@ Manages speaker output and audio playback
 
 import pygame
 import pyttsx3
+import itertools
+import json
 import logging
+import os
 import queue
+import select
+import shutil
+import signal
+import sys
 import threading
 import subprocess
 import tempfile
-import uuid
 import time
-from typing import Optional
+import wave
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple
 from pathlib import Path
+from xml.sax.saxutils import escape
+
+from .ring_buffer import SPSCRing
+
+try:
+    import sounddevice as sd
+    SOUNDDEVICE_AVAILABLE = True
+except (ImportError, OSError):
+    SOUNDDEVICE_AVAILABLE = False
+
+try:
+    from piper.voice import PiperVoice
+    PIPER_MODULE_AVAILABLE = True
+except ImportError:
+    PIPER_MODULE_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+PIPER_BATCH_SIZE = 8
+
+# Each --json-input process holds its own copy of the voice model
+PIPER_MAX_PROCESSES = 3
+
+# tmpfs keeps per-utterance WAVs off the SD card
+DEFAULT_TEMP_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+
+# Sequence for temp WAV names; unique within the process without uuid4()
+_wav_counter = itertools.count()
+
+
+def _temp_wav_path(temp_dir: str, prefix: str) -> Path:
+    """
+    Name a temporary WAV file for this process
+
+    Args:
+        temp_dir: Directory to put it in
+        prefix: Provider name used as the file prefix
+
+    Returns:
+        Path that no other call in this process will return
+    """
+    return Path(temp_dir) / f"{prefix}_{os.getpid()}_{next(_wav_counter)}.wav"
+
+
+# One Event per blocked _wait_for_channel() call; _stop_mixer() sets them all
+_channel_waiters = set()
+_channel_waiters_lock = threading.Lock()
+
+# Every live _StreamPlayer, so _stop_mixer() can cut off blocking writes too
+_stream_players = weakref.WeakSet()
+_stream_players_lock = threading.Lock()
+
+# Upper bound on audio still in the mixer's buffer once a sound's length
+# has elapsed (a 2048-frame buffer at 22050 Hz is ~93 ms)
+_MIXER_TAIL = 0.1
+
+
+@lru_cache(maxsize=64)
+def _load_sound(sound_file: str) -> pygame.mixer.Sound:
+    """Decode a sound file once and reuse it for later plays"""
+    return pygame.mixer.Sound(sound_file)
+
+
+def _read_wav(wav_path: str) -> Tuple[Tuple[int, int], bytes]:
+    """
+    Read a 16-bit WAV file into memory
+
+    Args:
+        wav_path: WAV file to read
+
+    Returns:
+        ((sample_rate, channels), PCM frames)
+    """
+    with wave.open(wav_path, 'rb') as wav:
+        if wav.getsampwidth() != 2:
+            raise ValueError(f"Unsupported sample width: {wav.getsampwidth()}")
+
+        return (wav.getframerate(), wav.getnchannels()), wav.readframes(wav.getnframes())
+
+
+_load_wav = lru_cache(maxsize=64)(_read_wav)
+
+
+class _StreamPlayer:
+    """
+    Persistent sounddevice output stream
+
+    Writes block in PortAudio until the audio is queued, so playback needs
+    no polling; the stream is reopened only when the format changes. Writers
+    from different threads take turns rather than interleaving, and abort()
+    cuts off the write in progress.
+    """
+
+    def __init__(self):
+        self._stream = None
+        self._stream_format = None
+        self._silence_cache = {}
+        self._lock = threading.Lock()
+        self._aborts = 0
+
+        with _stream_players_lock:
+            _stream_players.add(self)
+
+    def write(self, stream_format: Tuple[int, int], frames: bytes) -> bool:
+        """
+        Play 16-bit PCM frames
+
+        Args:
+            stream_format: (sample_rate, channels)
+            frames: Interleaved int16 PCM
+
+        Returns:
+            False if abort() cut the write short
+        """
+        with self._lock:
+            if self._stream is None or self._stream_format != stream_format:
+                self._close()
+                self._stream = sd.RawOutputStream(
+                    samplerate=stream_format[0],
+                    channels=stream_format[1],
+                    dtype='int16',
+                    latency='low'
+                )
+                self._stream_format = stream_format
+
+            return self._write(frames)
+
+    def write_silence(self, seconds: float) -> bool:
+        """
+        Write silence in the current stream format
+
+        Returns:
+            False if no stream is open yet
+        """
+        with self._lock:
+            if self._stream is None:
+                return False
+
+            sample_rate, channels = self._stream_format
+            key = (sample_rate, channels, seconds)
+
+            silence = self._silence_cache.get(key)
+            if silence is None:
+                silence = bytes(int(seconds * sample_rate) * channels * 2)
+                self._silence_cache[key] = silence
+
+            self._write(silence)
+            return True
+
+    def _write(self, frames: bytes) -> bool:
+        """Write to the open stream, restarting it after an abort; caller holds the lock"""
+        if self._stream.stopped:
+            self._stream.start()
+
+        aborts = self._aborts
+        try:
+            self._stream.write(frames)
+        except sd.PortAudioError:
+            if aborts == self._aborts:
+                raise
+
+        return aborts == self._aborts
+
+    def abort(self):
+        """
+        Drop queued audio and end a blocked write
+
+        Does not take the write lock, since a writer holds it for the whole
+        phrase; the next write restarts the stream.
+        """
+        stream = self._stream
+        if stream is None:
+            return
+
+        self._aborts += 1
+        try:
+            stream.abort()
+        except Exception as e:
+            logger.debug(f"Error aborting output stream: {e}")
+
+    def close(self):
+        """Close the stream if open"""
+        with self._lock:
+            self._close()
+
+    def _close(self):
+        if self._stream is not None:
+            try:
+                self._stream.close()
+            except Exception as e:
+                logger.debug(f"Error closing output stream: {e}")
+            self._stream = None
+            self._stream_format = None
+
+
+def _read_line(stream, buf: bytearray, timeout: float) -> Optional[bytes]:
+    """
+    Read one line from an unbuffered pipe without blocking past a timeout
+
+    Bytes read past the newline stay in buf for the next call, which is why
+    this does not use the file object's own readline().
+
+    Args:
+        stream: Raw (bufsize=0) pipe opened by subprocess
+        buf: Per-pipe carry-over buffer
+        timeout: Seconds to wait for each read
+
+    Returns:
+        The line without its newline, or None on timeout or EOF
+    """
+    while b'\n' not in buf:
+        ready, _, _ = select.select([stream], [], [], timeout)
+        if not ready:
+            return None
+
+        chunk = stream.read(4096)
+        if not chunk:
+            return None
+        buf += chunk
+
+    line, _, rest = bytes(buf).partition(b'\n')
+    buf[:] = rest
+    return line
+
+
+def _wait_for_channel(channel: pygame.mixer.Channel, sound: pygame.mixer.Sound):
+    """
+    Block until a channel finishes playing
+
+    Sleeps for the sound's known length in one go, plus at most one wait
+    for the mixer's buffer tail, instead of polling. A _stop_mixer() call
+    ends the wait immediately.
+
+    Args:
+        channel: Channel returned by Sound.play()
+        sound: The sound playing on it
+    """
+    stopped = threading.Event()
+    with _channel_waiters_lock:
+        _channel_waiters.add(stopped)
+
+    try:
+        if not stopped.wait(sound.get_length()) and channel.get_busy():
+            stopped.wait(_MIXER_TAIL)
+    finally:
+        with _channel_waiters_lock:
+            _channel_waiters.discard(stopped)
+
+
+def _stop_mixer():
+    """Stop every pygame channel and output stream, releasing threads waiting on them"""
+    pygame.mixer.stop()
+    with _channel_waiters_lock:
+        for stopped in _channel_waiters:
+            stopped.set()
+
+    with _stream_players_lock:
+        players = list(_stream_players)
+
+    for player in players:
+        player.abort()
+
 
 class AudioOutput:
     """Handles audio output to speaker"""
@@ -42,10 +311,29 @@ class AudioOutput:
 
         self.playback_queue = queue.Queue()
         self.is_playing = False
-        self.playback_thread: Optional[threading.Thread] = None
+        self.playback_thread = threading.Thread(target=self._playback_worker, daemon=True)
+        self.playback_thread.start()
+
+
+        # Blocking WAV effects go straight to PortAudio; other formats and
+        # fire-and-forget plays still use the pygame mixer
+        self._player = _StreamPlayer() if SOUNDDEVICE_AVAILABLE else None
+
+
+        for sound_file in self.audio_config.get('preload_sounds') or []:
+            self._preload_sound(sound_file)
 
         logger.info("Audio output initialized")
 
+    def _preload_sound(self, sound_file: str):
+        """Decode a sound effect into the caches ahead of its first play"""
+        try:
+            _load_sound(sound_file)
+            if self._player is not None and sound_file.lower().endswith('.wav'):
+                _load_wav(sound_file)
+        except Exception as e:
+            logger.warning(f"Could not preload sound {sound_file}: {e}")
+
     def play_sound(self, sound_file: str, wait: bool = False):
         """
         Play a sound effect
@@ -55,12 +343,14 @@ class AudioOutput:
             wait: If True, wait for sound to finish before returning
         """
         try:
-            sound = pygame.mixer.Sound(sound_file)
-            channel = sound.play()
+            if wait and self._player is not None and sound_file.lower().endswith('.wav'):
+                self._player.write(*_load_wav(sound_file))
+            else:
+                sound = _load_sound(sound_file)
+                channel = sound.play()
 
-            if wait and channel:
-                while channel.get_busy():
-                    pygame.time.wait(100)
+                if wait and channel:
+                    _wait_for_channel(channel, sound)
 
             logger.info(f"Played sound: {sound_file}")
 
@@ -76,12 +366,9 @@ class AudioOutput:
         """
         self.playback_queue.put(('sound', sound_file))
 
-        if not self.is_playing:
-            self._start_playback_thread()
-
     def stop_all_sounds(self):
         """Stop all currently playing sounds"""
-        pygame.mixer.stop()
+        _stop_mixer()
         logger.info("Stopped all sounds")
 
     def set_volume(self, volume: float):
@@ -95,49 +382,44 @@ class AudioOutput:
         pygame.mixer.music.set_volume(volume)
         logger.info(f"Volume set to {volume:.2f}")
 
-    def _start_playback_thread(self):
-        """Start background thread for audio playback"""
-        if self.playback_thread and self.playback_thread.is_alive():
-            return
-
-        self.is_playing = True
-        self.playback_thread = threading.Thread(target=self._playback_worker)
-        self.playback_thread.daemon = True
-        self.playback_thread.start()
-
     def _playback_worker(self):
-        """Background worker for playing queued audio"""
-        while self.is_playing or not self.playback_queue.empty():
+        """Background worker for playing queued audio; exits on a None item"""
+        while True:
+            item = self.playback_queue.get()
+            if item is None:
+                self.playback_queue.task_done()
+                return
+
+            self.is_playing = True
             try:
-                item = self.playback_queue.get(timeout=0.5)
                 item_type, data = item
 
                 if item_type == 'sound':
                     self.play_sound(data, wait=True)
 
-                self.playback_queue.task_done()
-
-            except queue.Empty:
-                continue
             except Exception as e:
                 logger.error(f"Playback worker error: {e}")
-
-        self.is_playing = False
+            finally:
+                self.is_playing = False
+                self.playback_queue.task_done()
 
     def cleanup(self):
         """Clean up audio resources"""
-        self.is_playing = False
         self.stop_all_sounds()
 
-        if self.playback_thread:
-            self.playback_thread.join(timeout=2.0)
+        self.playback_queue.put(None)
+        self.playback_thread.join(timeout=2.0)
 
+        _load_sound.cache_clear()
+        _load_wav.cache_clear()
+        if self._player is not None:
+            self._player.close()
         pygame.mixer.quit()
         logger.info("Audio output cleanup complete")
 
 
 class PiperTTSProvider:
-    """Text-to-speech provider using Piper binary"""
+    """Text-to-speech provider using Piper (in-process or the binary)"""
 
     def __init__(self, config: dict):
         """
@@ -153,27 +435,135 @@ class PiperTTSProvider:
         self.piper_binary = self.piper_config['binary_path']
         self.model_path = self.piper_config['model_path']
         self.length_scale = self.piper_config.get('length_scale', 1.0)
-        self.temp_dir = self.piper_config.get('temp_dir', '/tmp')
-
-
-        if not Path(self.piper_binary).exists():
-            raise FileNotFoundError(f"Piper binary not found: {self.piper_binary}")
+        self.temp_dir = self.piper_config.get('temp_dir', DEFAULT_TEMP_DIR)
 
 
         if not Path(self.model_path).exists():
             raise FileNotFoundError(f"Piper model not found: {self.model_path}")
 
 
+        # With the piper-tts package the ONNX voice runs in this process,
+        # so there is no binary to spawn and speak() can stream raw audio
+        self._voice = None
+        self._voice_lock = threading.Lock()
+        if PIPER_MODULE_AVAILABLE and self.piper_config.get('in_process', True):
+            try:
+                voice = PiperVoice.load(self.model_path, use_cuda=False)
+                if hasattr(voice, 'synthesize_stream_raw'):
+                    self._voice = voice
+                    logger.info("Piper voice loaded in-process")
+                else:
+                    logger.warning("Unsupported piper-tts version (needs 1.2.x), using binary")
+            except Exception as e:
+                logger.warning(f"Could not load Piper voice in-process, using binary: {e}")
+
+        if self._voice is None and not Path(self.piper_binary).exists():
+            raise FileNotFoundError(f"Piper binary not found: {self.piper_binary}")
+
+
         pygame.mixer.init()
 
 
+        # speak_async() pipeline: the synth worker renders the next phrase
+        # while the playback worker is still playing the current one. The
+        # hand-off between them is lock-free and holds two rendered phrases;
+        # stop_speaking() bumps _speech_gen so stale ones are dropped
         self.speech_queue = queue.Queue()
+        self.audio_buffer_q = SPSCRing(3)
+        self._speech_gen = 0
         self.is_speaking = False
-        self.speech_thread: Optional[threading.Thread] = None
         self.current_channel = None
+        self._player = _StreamPlayer() if SOUNDDEVICE_AVAILABLE else None
+        self.speech_thread = threading.Thread(target=self._synth_worker, daemon=True)
+        self.speech_thread.start()
+        self.playback_thread = threading.Thread(target=self._playback_worker, daemon=True)
+        self.playback_thread.start()
+
+
+        # Long-lived Piper processes in --json-input mode, one per
+        # length_scale (Piper fixes it per process), so the voice model is
+        # loaded once instead of on every utterance; least recently used first
+        self._piper_procs = OrderedDict()
+        self._piper_procs_lock = threading.Lock()
 
         logger.info(f"Piper TTS initialized with model: {self.model_path}")
 
+    def _piper_process(self, length_scale: float):
+        """
+        Get the running Piper process for a length_scale, starting it if needed
+
+        Args:
+            length_scale: Speech rate the process renders at
+
+        Returns:
+            (process, lock, stdout buffer) tuple, or None if Piper could not be started
+        """
+        with self._piper_procs_lock:
+            entry = self._piper_procs.get(length_scale)
+            if entry is not None and entry[0].poll() is None:
+                self._piper_procs.move_to_end(length_scale)
+                return entry
+
+            self._piper_procs.pop(length_scale, None)
+            self._evict_piper_processes()
+
+            try:
+                proc = subprocess.Popen(
+                    [
+                        self.piper_binary,
+                        '--model', self.model_path,
+                        '--length_scale', str(length_scale),
+                        '--output_dir', self.temp_dir,
+                        '--json-input'
+                    ],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    bufsize=0
+                )
+            except OSError as e:
+                logger.error(f"Could not start Piper: {e}")
+                return None
+
+            logger.debug(f"Started Piper process {proc.pid} (length_scale={length_scale})")
+            entry = (proc, threading.Lock(), bytearray())
+            self._piper_procs[length_scale] = entry
+            return entry
+
+    def _evict_piper_processes(self):
+        """
+        Stop idle Piper processes until there is room for another one
+
+        Least recently used processes go first; one that is rendering is
+        skipped, so the limit may be exceeded while every process is busy.
+        Caller holds _piper_procs_lock.
+        """
+        for length_scale, (proc, lock, _) in list(self._piper_procs.items()):
+            if len(self._piper_procs) < PIPER_MAX_PROCESSES:
+                return
+
+            if not lock.acquire(blocking=False):
+                continue
+
+            try:
+                del self._piper_procs[length_scale]
+                proc.kill()
+                proc.wait()
+            finally:
+                lock.release()
+
+            logger.debug(f"Stopped Piper process {proc.pid} (length_scale={length_scale})")
+
+    def _discard_piper_process(self, length_scale: float, proc: subprocess.Popen):
+        """Kill a Piper process that stopped responding; the next call respawns it"""
+        with self._piper_procs_lock:
+            entry = self._piper_procs.get(length_scale)
+            if entry is not None and entry[0] is proc:
+                del self._piper_procs[length_scale]
+
+        proc.kill()
+        proc.wait()
+
     def speak(self, text: str, wait: bool = False):
         """
         Convert text to speech and play
@@ -201,54 +591,232 @@ class PiperTTSProvider:
             text: Text to synthesize
             wait: If True, wait for playback to finish
         """
+        if wait and self._voice is not None and self._player is not None:
+            if self._stream_in_process(text):
+                return
 
-        temp_wav = Path(self.temp_dir) / f"piper_{uuid.uuid4()}.wav"
+        temp_wav = self.synthesize(text)
 
-        try:
+        if temp_wav is not None:
+            self.play_file(temp_wav, wait=wait)
 
-            cmd = [
-                self.piper_binary,
-                '--model', self.model_path,
-                '--length_scale', str(self.length_scale),
-                '--output_file', str(temp_wav)
-            ]
+    def synthesize(self, text: str, length_scale: Optional[float] = None) -> Optional[Path]:
+        """
+        Synthesize speech with Piper into a temporary WAV file
 
+        Renders go to a persistent Piper process per length_scale; renders at
+        different rates may run in parallel when length_scale is passed
+        explicitly.
 
-            subprocess.run(
-                cmd,
-                input=text,
-                text=True,
-                capture_output=True,
-                check=True,
-                timeout=10
-            )
+        Args:
+            text: Text to synthesize
+            length_scale: Optional rate override (defaults to set_rate value)
 
+        Returns:
+            Path to the WAV file, or None if synthesis failed
+        """
+        return self.synthesize_batch([text], length_scale)[0]
+
+    def synthesize_batch(
+        self,
+        texts: List[str],
+        length_scale: Optional[float] = None,
+        on_ready: Optional[Callable[[Optional[Path]], None]] = None
+    ) -> List[Optional[Path]]:
+        """
+        Synthesize several phrases with one write to the Piper process
 
-            if temp_wav.exists():
-                sound = pygame.mixer.Sound(str(temp_wav))
-                self.current_channel = sound.play()
+        All phrases are queued on Piper's stdin up front so it never idles
+        between them; results are collected in order as Piper reports them.
+
+        Args:
+            texts: Phrases to synthesize
+            length_scale: Optional rate override (defaults to set_rate value)
+            on_ready: Optional callback invoked with each result as soon as
+                it is available, before the rest of the batch finishes
 
-                if wait and self.current_channel:
+        Returns:
+            WAV path (or None on failure) for each phrase, in order
+        """
+        if length_scale is None:
+            length_scale = self.length_scale
 
-                    while self.current_channel.get_busy():
-                        pygame.time.wait(100)
+        if self._voice is not None:
+            return self._synthesize_in_process(texts, length_scale, on_ready)
 
+        results: List[Optional[Path]] = [None] * len(texts)
 
-                if not wait:
+        entry = self._piper_process(length_scale)
+        if entry is None:
+            if on_ready:
+                for _ in texts:
+                    on_ready(None)
+            return results
 
-                    threading.Timer(2.0, lambda: self._cleanup_wav(temp_wav)).start()
-                else:
-                    self._cleanup_wav(temp_wav)
+        proc, lock, out_buf = entry
+        wav_paths = [_temp_wav_path(self.temp_dir, 'piper') for _ in texts]
+        done = 0
+
+        try:
+            with lock:
+
+                # Piper writes each file, then echoes its path on stdout
+                proc.stdin.write(b''.join(
+                    json.dumps({'text': text, 'output_file': str(wav_path)}).encode() + b'\n'
+                    for text, wav_path in zip(texts, wav_paths)
+                ))
+
+                for i, wav_path in enumerate(wav_paths):
+                    line = _read_line(proc.stdout, out_buf, timeout=10)
+                    if line is None:
+                        logger.error("Piper synthesis timed out or the process exited")
+                        self._discard_piper_process(length_scale, proc)
+                        break
+
+                    if wav_path.exists():
+                        results[i] = wav_path
+
+                    done = i + 1
+                    if on_ready:
+                        on_ready(results[i])
 
-        except subprocess.TimeoutExpired:
-            logger.error("Piper synthesis timed out")
-            self._cleanup_wav(temp_wav)
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Piper synthesis failed: {e.stderr}")
-            self._cleanup_wav(temp_wav)
         except Exception as e:
             logger.error(f"Error synthesizing speech: {e}")
-            self._cleanup_wav(temp_wav)
+            self._discard_piper_process(length_scale, proc)
+
+        for wav_path in wav_paths[done:]:
+            self._cleanup_wav(wav_path)
+            if on_ready:
+                on_ready(None)
+
+        return results
+
+    def _synthesize_in_process(
+        self,
+        texts: List[str],
+        length_scale: float,
+        on_ready: Optional[Callable[[Optional[Path]], None]] = None
+    ) -> List[Optional[Path]]:
+        """
+        Render phrases to WAV files with the in-process Piper voice
+
+        Args:
+            texts: Phrases to synthesize
+            length_scale: Speech rate to render at
+            on_ready: Optional callback invoked with each result in turn
+
+        Returns:
+            WAV path (or None on failure) for each phrase, in order
+        """
+        results: List[Optional[Path]] = []
+        voice = self._voice
+
+        for i, text in enumerate(texts):
+            wav_path = _temp_wav_path(self.temp_dir, 'piper')
+            try:
+                with self._voice_lock, wave.open(str(wav_path), 'wb') as wav_file:
+                    voice.synthesize(text, wav_file, length_scale=length_scale)
+            except Exception as e:
+                self._cleanup_wav(wav_path)
+                self._disable_voice(e)
+                return results + self.synthesize_batch(texts[i:], length_scale, on_ready)
+
+            results.append(wav_path)
+            if on_ready:
+                on_ready(wav_path)
+
+        return results
+
+    def _stream_in_process(self, text: str):
+        """
+        Play text as the in-process voice renders it, one sentence at a time
+
+        Args:
+            text: Text to speak
+
+        Returns:
+            False if the voice failed before any audio was played, so the
+            caller should render the text with the binary instead
+        """
+        played = False
+        try:
+            voice = self._voice
+            stream_format = (voice.config.sample_rate, 1)
+            chunks = iter(voice.synthesize_stream_raw(text, length_scale=self.length_scale))
+
+
+            # espeak-ng phonemization is not thread-safe, so only rendering is
+            # serialized; playback of one sentence overlaps other renders
+            while True:
+                with self._voice_lock:
+                    audio_bytes = next(chunks, None)
+
+                if audio_bytes is None:
+                    break
+
+                played = True
+                if not self._player.write(stream_format, audio_bytes):
+                    break
+
+        except Exception as e:
+            self._disable_voice(e)
+
+        return played
+
+    def _disable_voice(self, error: Exception):
+        """Stop using the in-process voice after a render failure; later renders use the binary"""
+        if self._voice is not None:
+            logger.warning(f"In-process Piper failed, switching to binary: {error}")
+            self._voice = None
+
+    def play_file(self, wav_path: Path, wait: bool = True, keep: bool = False):
+        """
+        Play a synthesized WAV file and remove it
+
+        Blocking playback goes through a persistent sounddevice stream when
+        available; otherwise the pygame mixer is used.
+
+        Args:
+            wav_path: WAV file produced by synthesize()
+            wait: If True, wait for playback to finish
+            keep: If True, leave the file in place (e.g. a cached utterance)
+        """
+        try:
+            if wait and self._player is not None:
+                stream_format, frames = _read_wav(str(wav_path))
+                if not keep:
+                    self._cleanup_wav(wav_path)
+
+                self._player.write(stream_format, frames)
+                return
+
+            sound = pygame.mixer.Sound(str(wav_path))
+
+
+            # Sound() decodes the whole file into memory, so the temp file
+            # can go before playback starts
+            if not keep:
+                self._cleanup_wav(wav_path)
+
+            self.current_channel = sound.play()
+
+            if wait and self.current_channel:
+                _wait_for_channel(self.current_channel, sound)
+
+        except Exception as e:
+            logger.error(f"Error playing speech: {e}")
+            if not keep:
+                self._cleanup_wav(wav_path)
+
+    def play_silence(self, seconds: float):
+        """
+        Hold the speaker silent between utterances
+
+        Args:
+            seconds: Length of the pause
+        """
+        if self._player is None or not self._player.write_silence(seconds):
+            pygame.time.wait(int(seconds * 1000))
 
     def _cleanup_wav(self, wav_path: Path):
         """Clean up temporary WAV file"""
@@ -267,42 +835,97 @@ class PiperTTSProvider:
         """
         self.speech_queue.put(text)
 
-        if not self.is_speaking:
-            self._start_speech_thread()
+    def _synth_worker(self):
+        """Render queued text to WAV files in order; exits on a None item"""
+        while True:
+            texts = [self.speech_queue.get()]
 
-    def _start_speech_thread(self):
-        """Start background thread for TTS"""
-        if self.speech_thread and self.speech_thread.is_alive():
-            return
 
-        self.is_speaking = True
-        self.speech_thread = threading.Thread(target=self._speech_worker)
-        self.speech_thread.daemon = True
-        self.speech_thread.start()
+            # Hand everything already waiting to Piper in one batch
+            while texts[-1] is not None and len(texts) < PIPER_BATCH_SIZE:
+                try:
+                    texts.append(self.speech_queue.get_nowait())
+                except queue.Empty:
+                    break
 
-    def _speech_worker(self):
-        """Background worker for TTS queue"""
-        while self.is_speaking or not self.speech_queue.empty():
+            stop = texts[-1] is None
+            if stop:
+                texts.pop()
+
+            gen = self._speech_gen
             try:
-                text = self.speech_queue.get(timeout=0.5)
+                if texts:
+                    self.synthesize_batch(
+                        texts,
+                        on_ready=lambda wav_path: self._queue_rendered(gen, wav_path)
+                    )
+            except Exception as e:
+                logger.error(f"Speech worker error: {e}")
+            finally:
+                for _ in range(len(texts) + stop):
+                    self.speech_queue.task_done()
 
+            if stop:
+                self._push_rendered(None)
+                return
 
-                self._synthesize_and_play(text, wait=True)
+    def _queue_rendered(self, gen: int, wav_path: Optional[Path]):
+        """
+        Pass a rendered phrase from the synth worker to playback
 
-                self.speech_queue.task_done()
+        Args:
+            gen: Value of _speech_gen when the phrase was taken off the queue
+            wav_path: Rendered WAV file, or None if synthesis failed
+        """
+        if wav_path is not None:
+            self._push_rendered((gen, wav_path))
 
-            except queue.Empty:
+    def _push_rendered(self, item):
+        """
+        Push onto the playback ring, blocking while it already holds a full buffer
+
+        A phrase invalidated by stop_speaking() while waiting is deleted
+        instead of pushed.
+
+        Args:
+            item: (gen, wav_path) tuple, or None to stop the playback worker
+        """
+        ring = self.audio_buffer_q
+        while not ring.push(item):
+            if item is not None and item[0] != self._speech_gen:
+                self._cleanup_wav(item[1])
+                return
+
+            ring.wait_space(timeout=None)
+
+    def _playback_worker(self):
+        """Play rendered phrases in the order they were queued; exits on None"""
+        while True:
+            if not self.audio_buffer_q.wait(timeout=None):
                 continue
-            except Exception as e:
-                logger.error(f"Speech worker error: {e}")
 
-        self.is_speaking = False
+            item = self.audio_buffer_q.pop()
+            if item is None:
+                return
+
+            gen, wav_path = item
+            if gen != self._speech_gen:
+                self._cleanup_wav(wav_path)
+                continue
+
+            self.is_speaking = True
+            try:
+                self.play_file(wav_path, wait=True)
+            except Exception as e:
+                logger.error(f"Playback worker error: {e}")
+            finally:
+                self.is_speaking = False
 
     def stop_speaking(self):
         """Stop current speech"""
         try:
 
-            pygame.mixer.stop()
+            _stop_mixer()
 
 
             while not self.speech_queue.empty():
@@ -311,6 +934,11 @@ class PiperTTSProvider:
                 except queue.Empty:
                     break
 
+
+            # Only the playback worker may pop the ring, so rendered phrases
+            # are invalidated here and discarded there
+            self._speech_gen += 1
+
             logger.info("Speech stopped")
 
         except Exception as e:
@@ -336,12 +964,26 @@ class PiperTTSProvider:
 
     def cleanup(self):
         """Clean up TTS resources"""
-        self.is_speaking = False
         self.stop_speaking()
 
-        if self.speech_thread:
-            self.speech_thread.join(timeout=2.0)
+        self.speech_queue.put(None)
+        self.speech_thread.join(timeout=2.0)
+        self.playback_thread.join(timeout=2.0)
+
+        with self._piper_procs_lock:
+            procs = [entry[0] for entry in self._piper_procs.values()]
+            self._piper_procs.clear()
 
+        for proc in procs:
+            try:
+                proc.stdin.close()
+                proc.wait(timeout=2.0)
+            except (OSError, subprocess.TimeoutExpired):
+                proc.kill()
+
+        self._voice = None
+        if self._player is not None:
+            self._player.close()
         pygame.mixer.quit()
 
         logger.info("Piper TTS cleanup complete")
@@ -359,6 +1001,7 @@ class PyttxTTSProvider:
         """
         self.config = config
         self.tts_config = config['speech']['tts']['pyttsx3']
+        self.temp_dir = self.tts_config.get('temp_dir', DEFAULT_TEMP_DIR)
 
 
         self.engine = pyttsx3.init()
@@ -375,11 +1018,75 @@ class PyttxTTSProvider:
 
 
         self.speech_queue = queue.Queue()
-        self.is_speaking = False
-        self.speech_thread: Optional[threading.Thread] = None
+        self._worker_speaking = False
+        self.speech_thread = threading.Thread(target=self._speech_worker, daemon=True)
+        self.speech_thread.start()
+
+
+        # Output stream kept open between utterances so playback does not
+        # pay for a process spawn and ALSA device open every time
+        self._player = _StreamPlayer() if SOUNDDEVICE_AVAILABLE else None
+
+
+        # On Linux, background speech goes to one long-lived espeak-ng
+        # process fed line by line instead of a runAndWait() per utterance.
+        # It reports nothing back, so when it falls quiet is estimated from
+        # the word count and speech rate of what has been written to it
+        self._espeak: Optional[subprocess.Popen] = None
+        self._espeak_until = 0.0
+        self._start_espeak()
 
         logger.info("TTS initialized")
 
+    @property
+    def is_speaking(self) -> bool:
+        """True while the pyttsx3 worker talks or espeak-ng is estimated to"""
+        return self._worker_speaking or time.monotonic() < self._espeak_until
+
+    def _start_espeak(self):
+        """Spawn the espeak-ng stdin reader if it is available"""
+        if not sys.platform.startswith('linux') or not shutil.which('espeak-ng'):
+            return
+
+        self._espeak_rate = self.engine.getProperty('rate')
+        self._espeak_volume = self.engine.getProperty('volume')
+
+        # pyttsx3's espeak driver uses espeak voice identifiers as voice ids,
+        # so the configured voice carries over; -a is 0-200 with 100 as normal
+        cmd = ['espeak-ng', '-m', f'-s{int(self._espeak_rate)}',
+               f'-a{int(self._espeak_volume * 100)}']
+        voice = self.engine.getProperty('voice')
+        if voice:
+            cmd += ['-v', voice]
+        cmd.append('--stdin')
+
+        try:
+            self._espeak = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                bufsize=0
+            )
+            logger.debug(f"espeak-ng speech process started (pid {self._espeak.pid})")
+        except OSError as e:
+            logger.warning(f"Could not start espeak-ng, using pyttsx3 queue: {e}")
+            self._espeak = None
+
+    def _stop_espeak(self):
+        """Terminate the espeak-ng process, dropping anything it has queued"""
+        if self._espeak is None:
+            return
+
+        proc, self._espeak = self._espeak, None
+        try:
+            proc.send_signal(signal.SIGINT)
+            proc.wait(timeout=1.0)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+        except OSError:
+            pass
+
     def speak(self, text: str, wait: bool = False):
         """
         Convert text to speech and play
@@ -407,44 +1114,137 @@ class PyttxTTSProvider:
         Args:
             text: Text to speak
         """
-        self.speech_queue.put(text)
+        if self._espeak is not None and self._espeak.poll() is None:
+            try:
+                self._espeak.stdin.write(self._espeak_line(text))
 
-        if not self.is_speaking:
-            self._start_speech_thread()
+                start = max(time.monotonic(), self._espeak_until)
+                words_per_sec = max(1, self.engine.getProperty('rate')) / 60.0
+                self._espeak_until = start + len(text.split()) / words_per_sec
+                return
+            except OSError as e:
+                logger.warning(f"espeak-ng pipe failed, using pyttsx3 queue: {e}")
+                self._espeak = None
 
-    def _start_speech_thread(self):
-        """Start background thread for TTS"""
-        if self.speech_thread and self.speech_thread.is_alive():
-            return
+        self.speech_queue.put(text)
 
-        self.is_speaking = True
-        self.speech_thread = threading.Thread(target=self._speech_worker)
-        self.speech_thread.daemon = True
-        self.speech_thread.start()
+    def _espeak_line(self, text: str) -> bytes:
+        """
+        Build one espeak-ng input line carrying the current rate and volume
 
-    def _speech_worker(self):
-        """Background worker for TTS queue"""
-        while self.is_speaking or not self.speech_queue.empty():
-            try:
-                text = self.speech_queue.get(timeout=0.5)
+        set_rate()/set_volume() change per emotion, so they travel with each
+        line as SSML prosody relative to the values espeak-ng started with.
 
+        Args:
+            text: Text to speak
 
-                self.engine.say(text)
-                self.engine.runAndWait()
+        Returns:
+            Newline-terminated SSML line
+        """
+        rate = 100 * self.engine.getProperty('rate') / max(1, self._espeak_rate)
+        volume = 100 * self.engine.getProperty('volume') / max(0.01, self._espeak_volume)
+        text = escape(' '.join(text.split()))
+
+        return f'<prosody rate="{rate:.0f}%" volume="{volume:.0f}%">{text}</prosody>\n'.encode()
 
+    def _speech_worker(self):
+        """Background worker for TTS queue; exits on a None item"""
+        while True:
+            text = self.speech_queue.get()
+            if text is None:
                 self.speech_queue.task_done()
+                return
 
-            except queue.Empty:
-                continue
+            self._worker_speaking = True
+            try:
+                self.engine.say(text)
+                self.engine.runAndWait()
             except Exception as e:
                 logger.error(f"Speech worker error: {e}")
+            finally:
+                self._worker_speaking = False
+                self.speech_queue.task_done()
 
-        self.is_speaking = False
+    def synthesize(self, text: str) -> Optional[Path]:
+        """
+        Render speech into a temporary WAV file instead of the speakers
+
+        Args:
+            text: Text to synthesize
+
+        Returns:
+            Path to the WAV file, or None if synthesis failed
+        """
+        temp_wav = _temp_wav_path(self.temp_dir, 'pyttsx3')
+
+        try:
+            self.engine.save_to_file(text, str(temp_wav))
+            self.engine.runAndWait()
+
+            if temp_wav.exists():
+                return temp_wav
+
+        except Exception as e:
+            logger.error(f"Error synthesizing speech: {e}")
+
+        return None
+
+    def play_file(self, wav_path: Path, wait: bool = True, keep: bool = False):
+        """
+        Play a synthesized WAV file and remove it afterwards
+
+        Uses a persistent sounddevice stream when available, else aplay.
+
+        Args:
+            wav_path: WAV file produced by synthesize()
+            wait: If True, wait for playback to finish
+            keep: If True, leave the file in place (e.g. a cached utterance)
+        """
+        if not wait:
+            threading.Thread(target=self.play_file, args=(wav_path, True, keep), daemon=True).start()
+            return
+
+        try:
+            if self._player is not None:
+                self._player.write(*_read_wav(str(wav_path)))
+            else:
+                subprocess.run(['aplay', '-q', str(wav_path)], check=False)
+        except Exception as e:
+            logger.error(f"Error playing speech: {e}")
+
+        if keep:
+            return
+
+        try:
+            wav_path.unlink()
+        except OSError:
+            pass
+
+    def play_silence(self, seconds: float):
+        """
+        Write silence to the output stream between utterances
+
+        The gap then lives in the audio buffer instead of depending on
+        when the playback thread wakes up. Falls back to sleeping when
+        no stream is open.
+
+        Args:
+            seconds: Length of the pause
+        """
+        if self._player is None or not self._player.write_silence(seconds):
+            time.sleep(seconds)
 
     def stop_speaking(self):
         """Stop current speech"""
         try:
             self.engine.stop()
+            if self._player is not None:
+                self._player.abort()
+
+            if self._espeak is not None:
+                self._stop_espeak()
+                self._start_espeak()
+            self._espeak_until = 0.0
 
             while not self.speech_queue.empty():
                 try:
@@ -492,15 +1292,27 @@ class PyttxTTSProvider:
 
     def cleanup(self):
         """Clean up TTS resources"""
-        self.is_speaking = False
-        self.stop_speaking()
+        # espeak-ng is cut off whether or not it is still estimated to be talking
+        self._stop_espeak()
+
+        # Once runAndWait() has returned the driver is idle, so only stop
+        # it when the background worker is mid-utterance
+        if self._worker_speaking:
+            self.stop_speaking()
+
+        self.speech_queue.put(None)
+        self.speech_thread.join(timeout=2.0)
 
-        if self.speech_thread:
-            self.speech_thread.join(timeout=2.0)
+        if self._player is not None:
+            self._player.close()
 
         logger.info("TTS cleanup complete")
 
 
+def _ignore_setting(value):
+    """Stand-in for voice settings a TTS provider does not support"""
+
+
 class TextToSpeech:
     """
     TTS Factory - Creates appropriate TTS provider based on configuration
@@ -531,27 +1343,19 @@ class TextToSpeech:
 
         self.provider_name = provider_name
 
-    def speak(self, text: str, wait: bool = False):
-        """Delegate to provider"""
-        return self.provider.speak(text, wait)
-
-    def speak_async(self, text: str):
-        """Delegate to provider"""
-        return self.provider.speak_async(text)
-
-    def stop_speaking(self):
-        """Delegate to provider"""
-        return self.provider.stop_speaking()
 
-    def set_rate(self, rate: float):
-        """Delegate to provider (behavior differs by provider)"""
-        if hasattr(self.provider, 'set_rate'):
-            return self.provider.set_rate(rate)
-
-    def set_volume(self, volume: float):
-        """Delegate to provider"""
-        if hasattr(self.provider, 'set_volume'):
-            return self.provider.set_volume(volume)
+        # Calls go straight to the provider's bound methods rather than
+        # through a forwarding wrapper; optional ones are resolved once here
+        provider = self.provider
+        self.speak = provider.speak
+        self.speak_async = provider.speak_async
+        self.synthesize = provider.synthesize
+        self.play_file = provider.play_file
+        self.play_silence = provider.play_silence
+        self.stop_speaking = provider.stop_speaking
+        self.cleanup = provider.cleanup
+        self.set_rate = getattr(provider, 'set_rate', _ignore_setting)
+        self.set_volume = getattr(provider, 'set_volume', _ignore_setting)
 
     def list_voices(self):
         """List available voices (pyttsx3 only)"""
@@ -561,10 +1365,6 @@ class TextToSpeech:
             logger.warning(f"{self.provider_name} does not support list_voices()")
             return []
 
-    def cleanup(self):
-        """Delegate to provider"""
-        return self.provider.cleanup()
-
     @property
     def is_speaking(self):
         """Check if currently speaking"""
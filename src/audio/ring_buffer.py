@@ -0,0 +1,133 @@
+"""
+Ring Buffer
+Lock-free single-producer/single-consumer queue for the audio threads
+"""
+
+import threading
+from typing import Optional
+
+
+class SPSCRing:
+    """
+    Fixed-size single-producer/single-consumer ring of audio items
+
+    The producer only ever writes the head index and the consumer only ever
+    writes the tail index, so neither side takes a lock; one Event wakes the
+    consumer when new data arrives and another wakes a producer waiting for
+    a free slot.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initialize ring buffer
+
+        Args:
+            capacity: Number of slots (one is kept empty to tell full from empty)
+        """
+        self._capacity = capacity
+        self._buf = [None] * capacity
+        self._head = 0
+        self._tail = 0
+        self._wake = threading.Event()
+        self._space = threading.Event()
+
+    def push(self, item) -> bool:
+        """
+        Append an item (producer side)
+
+        Returns:
+            False if the ring is full and the item was dropped
+        """
+        idx = self._head
+        nxt = (idx + 1) % self._capacity
+        if nxt == self._tail:
+            return False
+
+        self._buf[idx] = item
+        self._head = nxt
+        self._wake.set()
+        return True
+
+    def pop(self):
+        """
+        Remove the oldest item (consumer side)
+
+        Returns:
+            The item, or None if the ring is empty
+        """
+        idx = self._tail
+        if idx == self._head:
+            return None
+
+        item = self._buf[idx]
+        self._buf[idx] = None
+        self._tail = (idx + 1) % self._capacity
+        self._space.set()
+        return item
+
+    def drain(self) -> list:
+        """
+        Remove every item published so far in one head/tail sweep (consumer side)
+
+        Returns:
+            List of items, oldest first
+        """
+        tail = self._tail
+        head = self._head
+        if tail == head:
+            return []
+
+        buf = self._buf
+        if tail < head:
+            items = buf[tail:head]
+            buf[tail:head] = [None] * (head - tail)
+        else:
+            items = buf[tail:] + buf[:head]
+            buf[tail:] = [None] * (self._capacity - tail)
+            buf[:head] = [None] * head
+
+        self._tail = head
+        self._space.set()
+        return items
+
+    def wait(self, timeout: Optional[float]) -> bool:
+        """
+        Block until the producer signals new data or the timeout expires
+
+        Args:
+            timeout: Seconds to wait, or None to wait for the next push
+
+        Returns:
+            True if the ring has data
+        """
+        if self._tail == self._head:
+            self._wake.wait(timeout)
+        self._wake.clear()
+        return self._tail != self._head
+
+    def wait_space(self, timeout: Optional[float]) -> bool:
+        """
+        Block until the consumer frees a slot or the timeout expires (producer side)
+
+        Args:
+            timeout: Seconds to wait, or None to wait for the next pop
+
+        Returns:
+            True if the ring has room for a push
+        """
+        if self.full():
+            self._space.wait(timeout)
+        self._space.clear()
+        return not self.full()
+
+    def interrupt(self):
+        """Wake a blocked consumer without publishing anything"""
+        self._wake.set()
+
+    def empty(self) -> bool:
+        """Check whether the ring holds no items"""
+        return self._tail == self._head
+
+    def full(self) -> bool:
+        """Check whether the ring has no free slot"""
+        return (self._head + 1) % self._capacity == self._tail
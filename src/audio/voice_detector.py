@@ -6,12 +6,83 @@ Enhanced voice detection for mini microphone
 import numpy as np
 import webrtcvad
 import logging
+from bisect import bisect_left, insort
 from collections import deque
-from scipy import signal
+from math import gcd
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
 
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _mean_abs_i16(samples):
+        """Mean absolute value of int16 samples in one compiled pass"""
+        n = samples.shape[0]
+        if n == 0:
+            return 0.0
+
+        total = 0
+        for i in range(n):
+            v = np.int64(samples[i])
+            total += v if v >= 0 else -v
+        return total / n
+
+else:
+
+    def _mean_abs_i16(samples):
+        """Mean absolute value of int16 samples, widened so -32768 does not wrap"""
+        if len(samples) == 0:
+            return 0.0
+        return int(np.abs(samples, dtype=np.int32).sum(dtype=np.int64)) / len(samples)
+
+
+def _polyphase_taps(up: int, down: int, n_out: int):
+    """
+    Precompute a polyphase resampler as per-output gather indices and weights
+
+    Matches scipy.signal.resample_poly with its default Kaiser (beta 5.0)
+    low-pass filter, for the first n_out output samples.
+
+    Args:
+        up: Upsampling factor
+        down: Downsampling factor
+        n_out: Number of output samples
+
+    Returns:
+        (indices, weights) arrays of shape (n_out, taps); output k is
+        sum(x[indices[k]] * weights[k])
+    """
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    numtaps = 2 * half_len + 1
+
+    h = np.sinc((np.arange(numtaps) - half_len) / max_rate) * np.kaiser(numtaps, 5.0)
+    h *= up / h.sum()
+
+
+    # Same alignment as resample_poly: pad the filter so output 0 lines up
+    # with input 0, then walk the filter in steps of `up` for each output
+    pre_pad = down - half_len % down
+    h = np.concatenate((np.zeros(pre_pad), h))
+    pre_remove = (half_len + pre_pad) // down
+
+    t = (np.arange(n_out) + pre_remove) * down
+    taps = -(-len(h) // up) + 1
+    indices = (t // up)[:, None] - np.arange(taps)
+    offsets = t[:, None] - indices * up
+
+    valid = (offsets < len(h)) & (indices >= 0)
+    weights = np.where(valid, h[np.minimum(offsets, len(h) - 1)], 0.0)
+    return np.maximum(indices, 0), weights.astype(np.float32)
+
+
 class VoiceActivityDetector:
     """Advanced voice activity detection with noise filtering"""
 
@@ -30,8 +101,52 @@ class VoiceActivityDetector:
         self.vad = webrtcvad.Vad(self.vad_config['vad_aggressiveness'])
 
 
+        # WebRTC VAD runs on 30 ms frames at 16 kHz; other input rates go
+        # through a polyphase resampler whose taps are laid out once, so
+        # resampling a frame is one gather and a row-wise dot product
+        self.vad_sample_rate = 16000
+        self.vad_frame_size = int(self.vad_sample_rate * 30 / 1000)
+        self.vad_resample = self.sample_rate != self.vad_sample_rate
+
+        if self.vad_resample:
+            g = gcd(self.sample_rate, self.vad_sample_rate)
+            self.vad_up = self.vad_sample_rate // g
+            self.vad_dn = self.sample_rate // g
+            self._vad_taps, self._vad_weights = _polyphase_taps(
+                self.vad_up, self.vad_dn, self.vad_frame_size
+            )
+
+            # Only the input needed for one VAD frame is resampled; taps that
+            # reach past it read the zeroed tail of the buffer
+            self.vad_input_size = -(-self.vad_frame_size * self.vad_dn // self.vad_up)
+            self._vad_input = np.zeros(
+                max(self.vad_input_size, int(self._vad_taps.max()) + 1), dtype=np.float32
+            )
+
+
+        # One reusable frame; short input leaves a zeroed tail instead of np.pad
+        self._vad_frame = np.zeros(self.vad_frame_size, dtype=np.int16)
+
+
+        # webrtcvad reads any contiguous buffer, so pass a byte view of the
+        # frame instead of a tobytes() copy; builds that want bytes get None
+        self._vad_view = memoryview(self._vad_frame).cast('B')
+        try:
+            self.vad.is_speech(self._vad_view, self.vad_sample_rate)
+        except TypeError:
+            logger.debug("webrtcvad needs bytes input, copying VAD frames")
+            self._vad_view = None
+        except Exception as e:
+            logger.debug(f"VAD probe failed: {e}")
+
+
+        # Compile the amplitude kernel now rather than on the first live frame
+        _mean_abs_i16(np.zeros(16, dtype=np.int16))
+
+
         self.noise_floor = self.vad_config['silence_threshold']
         self.noise_floor_samples = deque(maxlen=100)
+        self._sorted_noise_samples = []
 
 
         self.is_voice_active = False
@@ -41,6 +156,7 @@ class VoiceActivityDetector:
 
         self.min_voice_frames = 3
         self.max_silence_frames = 10
+        self.fast_accept_ratio = 10.0
 
     def detect(self, audio_chunk: bytes) -> bool:
         """
@@ -56,9 +172,7 @@ class VoiceActivityDetector:
         audio_array = np.frombuffer(audio_chunk, dtype=np.int16)
 
 
-        amplitude = np.abs(audio_array).mean()
-
-
+        amplitude = _mean_abs_i16(audio_array)
         self._update_noise_floor(amplitude)
 
 
@@ -67,10 +181,15 @@ class VoiceActivityDetector:
         amplitude_check = amplitude > amplitude_threshold
 
 
-        vad_check = self._check_webrtc_vad(audio_chunk)
-
-
-        is_voice = amplitude_check and vad_check
+        # WebRTC VAD (and its resample) only runs in the uncertain band:
+        # frames below the amplitude gate are silence, and frames far above
+        # the noise floor are accepted as voice outright
+        if not amplitude_check:
+            is_voice = False
+        elif amplitude >= self.noise_floor * self.fast_accept_ratio:
+            is_voice = True
+        else:
+            is_voice = self._check_webrtc_vad(audio_array)
 
 
         if not hasattr(self, '_debug_counter'):
@@ -78,9 +197,20 @@ class VoiceActivityDetector:
         self._debug_counter += 1
         if self._debug_counter % 50 == 0:
             logger.debug(f"VAD: amp={amplitude:.0f}, threshold={amplitude_threshold:.0f}, "
-                        f"amp_ok={amplitude_check}, vad_ok={vad_check}, voice={is_voice}")
+                        f"amp_ok={amplitude_check}, voice={is_voice}")
 
+        return self._update_state(is_voice)
 
+    def _update_state(self, is_voice: bool) -> bool:
+        """
+        Advance the voice/silence frame counters with one frame's decision
+
+        Args:
+            is_voice: Whether this frame was classified as voice
+
+        Returns:
+            True while voice activity is considered ongoing
+        """
         if is_voice:
             self.voice_frames += 1
             self.silence_frames = 0
@@ -103,48 +233,48 @@ class VoiceActivityDetector:
         Args:
             amplitude: Current amplitude value
         """
-        self.noise_floor_samples.append(amplitude)
+        # Mirror the window in a sorted list so the median is an index
+        # lookup instead of a full sort per frame
+        window = self.noise_floor_samples
+        ordered = self._sorted_noise_samples
 
-        if len(self.noise_floor_samples) >= 10:
+        if len(window) == window.maxlen:
+            del ordered[bisect_left(ordered, window[0])]
 
-            self.noise_floor = np.median(list(self.noise_floor_samples))
+        window.append(amplitude)
+        insort(ordered, amplitude)
 
-    def _check_webrtc_vad(self, audio_chunk: bytes) -> bool:
+        n = len(ordered)
+        if n >= 10:
+            mid = n // 2
+            self.noise_floor = ordered[mid] if n % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+
+    def _check_webrtc_vad(self, audio_array: np.ndarray) -> bool:
         """
         Check voice activity using WebRTC VAD
 
         Args:
-            audio_chunk: Raw audio bytes
+            audio_array: int16 samples already decoded by detect()
 
         Returns:
             True if voice detected by WebRTC VAD
         """
         try:
-            audio_array = np.frombuffer(audio_chunk, dtype=np.int16)
-
-
-
-            target_rate = 16000
-            if self.sample_rate != target_rate:
-
-                num_samples = int(len(audio_array) * target_rate / self.sample_rate)
-                audio_array = signal.resample(audio_array, num_samples).astype(np.int16)
-                vad_sample_rate = target_rate
+            frame = self._vad_frame
+
+            if self.vad_resample:
+                buf = self._vad_input
+                n = min(len(audio_array), self.vad_input_size)
+                buf[:n] = audio_array[:n]
+                buf[n:self.vad_input_size] = 0
+                frame[:] = np.einsum('ij,ij->i', buf[self._vad_taps], self._vad_weights)
             else:
-                vad_sample_rate = self.sample_rate
-
-
-            frame_duration = 30
-            frame_size = int(vad_sample_rate * frame_duration / 1000)
-
-
-            if len(audio_array) < frame_size:
-                audio_array = np.pad(audio_array, (0, frame_size - len(audio_array)))
-            elif len(audio_array) > frame_size:
-                audio_array = audio_array[:frame_size]
+                n = min(len(audio_array), self.vad_frame_size)
+                frame[:n] = audio_array[:n]
+                frame[n:] = 0
 
-            audio_bytes = audio_array.tobytes()
-            return self.vad.is_speech(audio_bytes, vad_sample_rate)
+            view = self._vad_view
+            return self.vad.is_speech(view if view is not None else frame.tobytes(), self.vad_sample_rate)
 
         except Exception as e:
             logger.debug(f"WebRTC VAD error: {e}")
@@ -156,6 +286,7 @@ class VoiceActivityDetector:
         self.voice_frames = 0
         self.silence_frames = 0
         self.noise_floor_samples.clear()
+        self._sorted_noise_samples.clear()
         logger.debug("Voice detector reset")
 
     def get_confidence(self) -> float:
@@ -0,0 +1,63 @@
+"""
+Config Loader
+Loads settings.yaml with libyaml and a pickle cache keyed on file mtime and size
+"""
+
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Union
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+logger = logging.getLogger(__name__)
+
+
+def load_config(path: Union[str, Path]) -> dict:
+    """
+    Load a YAML config file, reusing a pickled copy when it is up to date
+
+    The cache lives next to the YAML file as '<name>.yaml.pkl' and records
+    the YAML file's mtime and size; it is rebuilt unless both match exactly,
+    so a replacement with an older mtime (cp -p, rsync -t) is still picked up.
+
+    Args:
+        path: Path to settings.yaml
+
+    Returns:
+        Parsed configuration dictionary
+    """
+    path = Path(path)
+    cache_path = path.with_suffix(path.suffix + '.pkl')
+
+    try:
+        st = path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+
+        with open(cache_path, 'rb') as f:
+            cached_stamp, config = pickle.load(f)
+        if cached_stamp == stamp:
+            return config
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"Ignoring stale config cache {cache_path}: {e}")
+
+    with open(path) as f:
+        config = yaml.load(f, Loader=_SafeLoader)
+
+    try:
+        tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((stamp, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"Could not write config cache {cache_path}: {e}")
+
+    return config
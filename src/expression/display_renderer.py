@@ -10,8 +10,11 @@ except ImportError:
 import os
 import glob
 import logging
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any
 
 from .procedural_face import ProceduralFaceRenderer
 
@@ -20,6 +23,31 @@ from .procedural_face import ProceduralFaceRenderer
 logger = logging.getLogger(__name__)
 EmotionFrames = Tuple[pygame.Surface, pygame.Surface]
 
+# Transition alpha is quantized to this many steps so blends can be reused
+BLEND_STEPS = 16
+
+# Enough blended frames for one emotion pair in both directions
+BLEND_CACHE_SIZE = 2 * BLEND_STEPS
+
+# Sprites written by scripts/pre_scale_sprites.py, e.g. happy_320x240.png
+_SCALED_VARIANT = re.compile(r"_\d+x\d+$")
+
+
+def scaled_variant_path(image_path: str, screen_size: Tuple[int, int]) -> Path:
+    """
+    Path of a sprite's pre-scaled copy for a given resolution
+
+    Args:
+        image_path: Original PNG file
+        screen_size: Display resolution (width, height)
+
+    Returns:
+        Path of '<stem>_<W>x<H>.png' next to the original
+    """
+    path = Path(image_path)
+    width, height = screen_size
+    return path.with_name(f"{path.stem}_{width}x{height}{path.suffix}")
+
 
 class DisplayRenderer:
     """
@@ -49,6 +77,16 @@ class DisplayRenderer:
 
         self.emotion_images: Dict[str, EmotionFrames] = {}
         self.listening_image: Optional[pygame.Surface] = None
+        self._blend_cache: "OrderedDict[Tuple[int, int, int], pygame.Surface]" = OrderedDict()
+        self._atlas: Optional[pygame.Surface] = None
+
+
+        # Frame lookup used at render time: parallel base/speaking lists
+        # indexed through one name -> index table
+        self._base_frames: List[pygame.Surface] = []
+        self._speak_frames: List[pygame.Surface] = []
+        self._emotion_idx: Dict[str, int] = {}
+        self._happy_idx: Optional[int] = None
 
 
         procedural_config = procedural_config or {}
@@ -58,6 +96,17 @@ class DisplayRenderer:
 
         self._init_pygame()
 
+
+        # Holds the weighted target sprite while a blend is composed
+        self._blend_scratch = pygame.Surface(self.screen_size, pygame.SRCALPHA)
+
+
+        # Per-step (from, to) modulation colours for the MULT fills
+        self._blend_fills = []
+        for step in range(BLEND_STEPS):
+            weight = int(255 * step / (BLEND_STEPS - 1) + 0.5)
+            self._blend_fills.append(((255 - weight,) * 4, (weight,) * 4))
+
         if self.use_procedural:
             self.procedural_renderer = ProceduralFaceRenderer(
                 self.screen_size, procedural_config
@@ -107,10 +156,10 @@ class DisplayRenderer:
             return
 
 
-        base_files = glob.glob(str(self.image_dir / "*.png"))
-
-        loaded_count = 0
-        for base_path in base_files:
+        # Pair up files first, then decode every PNG in parallel; SDL_image
+        # releases the GIL while decoding
+        jobs = []
+        for base_path in glob.glob(str(self.image_dir / "*.png")):
             filename = os.path.basename(base_path)
 
 
@@ -118,22 +167,46 @@ class DisplayRenderer:
                 continue
 
             emotion_name = os.path.splitext(filename)[0]
+            if _SCALED_VARIANT.search(emotion_name):
+                continue
+
+            speaking_path = self.image_dir / f"{emotion_name}_speaking.png"
+            jobs.append((
+                emotion_name,
+                base_path,
+                str(speaking_path) if speaking_path.exists() else None,
+            ))
+
+        # Pre-scaled copies, when present, already match the screen and
+        # skip smoothscale in _prepare_image()
+        paths = [path for job in jobs for path in job[1:] if path]
+        sources = []
+        for path in paths:
+            variant = scaled_variant_path(path, self.screen_size)
+            sources.append(str(variant) if variant.exists() else path)
 
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            decoded = dict(zip(paths, pool.map(self._decode_image, sources)))
 
-            if emotion_name == "listening":
-                self._load_listening_image(base_path)
+
+        # convert_alpha() needs the display, so finish on this thread
+        loaded_count = 0
+        for emotion_name, base_path, speaking_path in jobs:
+            if decoded[base_path] is None:
                 continue
 
 
             try:
-                base_surface = self._load_and_scale_image(base_path)
+                if emotion_name == "listening":
+                    self.listening_image = self._prepare_image(decoded[base_path])
+                    logger.debug("Loaded listening state image")
+                    continue
 
+                base_surface = self._prepare_image(decoded[base_path])
 
-                speaking_path = self.image_dir / f"{emotion_name}_speaking.png"
-                if speaking_path.exists():
-                    speaking_surface = self._load_and_scale_image(
-                        str(speaking_path)
-                    )
+
+                if speaking_path is not None and decoded[speaking_path] is not None:
+                    speaking_surface = self._prepare_image(decoded[speaking_path])
                 else:
 
                     speaking_surface = base_surface
@@ -156,32 +229,104 @@ class DisplayRenderer:
 
         if loaded_count == 0:
             logger.error("No emotion images loaded; display disabled.")
+        else:
+            self._build_atlas()
+            self._index_frames()
+
+    def _build_atlas(self):
+        """
+        Pack every emotion frame side by side into one surface
+
+        emotion_images is rewritten to hold subsurfaces of the atlas, so all
+        sprite blits read from a single allocation and the per-image
+        surfaces can be freed.
+        """
+        width, height = self.screen_size
+
+        frames = []
+        for base_surface, speaking_surface in self.emotion_images.values():
+            frames.append(base_surface)
+            if speaking_surface is not base_surface:
+                frames.append(speaking_surface)
+
+        if any(frame.get_flags() & pygame.SRCALPHA for frame in frames):
+            self._atlas = pygame.Surface((width * len(frames), height), pygame.SRCALPHA).convert_alpha()
+        else:
+            self._atlas = pygame.Surface((width * len(frames), height)).convert()
 
-    def _load_listening_image(self, base_path: str):
-        """Load the special listening state image"""
+        slots = {}
+        for i, frame in enumerate(frames):
+            # Adding onto the zeroed atlas copies pixels exactly, alpha included
+            self._atlas.blit(frame, (i * width, 0), special_flags=pygame.BLEND_RGBA_ADD)
+            slots[id(frame)] = self._atlas.subsurface(pygame.Rect(i * width, 0, width, height))
+
+        self.emotion_images = {
+            name: (slots[id(base_surface)], slots[id(speaking_surface)])
+            for name, (base_surface, speaking_surface) in self.emotion_images.items()
+        }
+
+    def _index_frames(self):
+        """Lay emotion_images out as the parallel lists get_emotion_frame() reads"""
+        self._base_frames = []
+        self._speak_frames = []
+        self._emotion_idx = {}
+
+        for name, (base_surface, speaking_surface) in self.emotion_images.items():
+            self._emotion_idx[name] = len(self._base_frames)
+            self._base_frames.append(base_surface)
+            self._speak_frames.append(speaking_surface)
+
+        self._happy_idx = self._emotion_idx.get('happy')
+
+    def _decode_image(self, image_path: str) -> Optional[pygame.Surface]:
+        """
+        Decode a PNG file (safe to run off the main thread)
+
+        Args:
+            image_path: Path to PNG file
+
+        Returns:
+            Decoded surface, or None if the file could not be loaded
+        """
         try:
-            self.listening_image = self._load_and_scale_image(base_path)
-            logger.debug("Loaded listening state image")
+            return pygame.image.load(image_path)
         except pygame.error as e:
-            logger.error("Failed to load listening image: %s", e)
+            logger.error("Failed to load %s: %s", image_path, e)
+            return None
 
-    def _load_and_scale_image(self, image_path: str) -> pygame.Surface:
+    def _prepare_image(self, surface: pygame.Surface) -> pygame.Surface:
         """
-        Load PNG image and scale to screen size if needed
+        Convert a decoded image for fast blits and scale it to the screen
+
+        Fully opaque sprites are converted to the screen's own pixel format
+        (e.g. RGB565 on the piTFT) so blits need no per-pixel conversion;
+        only sprites that use transparency keep an alpha channel.
 
         Args:
-            image_path: Path to PNG file
+            surface: Surface from _decode_image()
 
         Returns:
-            Scaled pygame surface with alpha channel
+            Scaled pygame surface in display format
         """
-        surface = pygame.image.load(image_path).convert_alpha()
+        opaque = self._is_opaque(surface)
 
 
+        # smoothscale needs 24/32-bit input, so scale before converting
         if surface.get_size() != self.screen_size:
-            surface = pygame.transform.smoothscale(surface, self.screen_size)
+            surface = pygame.transform.smoothscale(surface.convert_alpha(), self.screen_size)
+
+        return surface.convert() if opaque else surface.convert_alpha()
+
+    @staticmethod
+    def _is_opaque(surface: pygame.Surface) -> bool:
+        """Check whether a decoded image has no transparent pixels"""
+        if surface.get_colorkey() is not None:
+            return False
+        if not surface.get_flags() & pygame.SRCALPHA:
+            return True
 
-        return surface
+        width, height = surface.get_size()
+        return pygame.mask.from_surface(surface, 254).count() == width * height
 
     def get_emotion_frame(
         self, emotion: str, speaking: bool = False
@@ -196,18 +341,18 @@ class DisplayRenderer:
         Returns:
             Pygame surface or None if emotion not found
         """
-        if emotion not in self.emotion_images:
+        idx = self._emotion_idx.get(emotion)
+        if idx is None:
             logger.warning(
                 "Emotion '%s' not found, using 'happy' fallback", emotion
             )
-            emotion = 'happy'
+            idx = self._happy_idx
 
-            if emotion not in self.emotion_images:
+            if idx is None:
                 logger.error("Fallback emotion 'happy' also missing!")
                 return None
 
-        base_frame, speaking_frame = self.emotion_images[emotion]
-        return speaking_frame if speaking else base_frame
+        return (self._speak_frames if speaking else self._base_frames)[idx]
 
     def get_listening_frame(self) -> Optional[pygame.Surface]:
         """Get listening state surface"""
@@ -262,35 +407,73 @@ class DisplayRenderer:
         """
         Create alpha-blended composite of two images for smooth transitions
 
+        Alpha is quantized to BLEND_STEPS levels and recent composites are
+        cached per (img1, img2, step), so a transition between sprites that
+        has been seen before is just a lookup.
+
         Args:
             img1: Current emotion surface
             img2: Target emotion surface
             alpha: Blend factor (0.0 = all img1, 1.0 = all img2)
 
         Returns:
-            Blended surface
+            Blended surface (do not modify; it may be shared)
         """
         if img1 is None or img2 is None:
             logger.error("Cannot blend None surfaces")
             return img1 if img1 is not None else img2
 
 
-        alpha = max(0.0, min(1.0, alpha))
+        step = int(max(0.0, min(1.0, alpha)) * (BLEND_STEPS - 1) + 0.5)
+        if step == 0:
+            return img1
+        if step == BLEND_STEPS - 1:
+            return img2
+
+        key = (id(img1), id(img2), step)
+        result = self._blend_cache.get(key)
+        if result is not None:
+            self._blend_cache.move_to_end(key)
+            return result
 
+        fill_from, fill_to = self._blend_fills[step]
 
+        # result = img1 * (1 - alpha) + img2 * alpha, one SDL pass per term:
+        # a solid fill scaled by each sprite, then a saturating add
         result = pygame.Surface(self.screen_size, pygame.SRCALPHA)
+        result.fill(fill_from)
+        result.blit(img1, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
 
+        scratch = self._blend_scratch
+        scratch.fill(fill_to)
+        scratch.blit(img2, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        result.blit(scratch, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
 
-        img1_copy = img1.copy()
-        img1_copy.set_alpha(int(255 * (1 - alpha)))
-        result.blit(img1_copy, (0, 0))
+        self._blend_cache[key] = result
+        if len(self._blend_cache) > BLEND_CACHE_SIZE:
+            self._blend_cache.popitem(last=False)
+
+        return result
 
+    def render_blended(
+        self,
+        img1: pygame.Surface,
+        img2: pygame.Surface,
+        alpha: float,
+    ):
+        """
+        Render a transition frame to the screen
 
-        img2_copy = img2.copy()
-        img2_copy.set_alpha(int(255 * alpha))
-        result.blit(img2_copy, (0, 0))
+        The composite comes from create_blended_frame(), which builds each
+        quantized step once and caches it, so every later frame of the same
+        transition is a single blit.
 
-        return result
+        Args:
+            img1: Current emotion surface
+            img2: Target emotion surface
+            alpha: Blend factor (0.0 = all img1, 1.0 = all img2)
+        """
+        self.render_frame(self.create_blended_frame(img1, img2, alpha))
 
     def clear_screen(self, color: Tuple[int, int, int] = (0, 0, 0)):
         """
@@ -303,5 +486,6 @@ class DisplayRenderer:
 
     def cleanup(self):
         """Clean up pygame resources"""
+        self._blend_cache.clear()
         pygame.quit()
         logger.info("Display renderer cleanup complete")
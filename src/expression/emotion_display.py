@@ -668,10 +668,7 @@ class EmotionDisplay:
                 )
 
                 if from_frame and to_frame:
-                    blended = self.renderer.create_blended_frame(
-                        from_frame, to_frame, alpha
-                    )
-                    self.renderer.render_frame(blended)
+                    self.renderer.render_blended(from_frame, to_frame, alpha)
                     return
 
 
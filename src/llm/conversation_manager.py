@@ -9,7 +9,7 @@ import sys
 import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Iterator
-from collections import deque
+from collections import Counter, deque
 
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -19,6 +19,11 @@ from llm.ollama_client import OllamaClient
 logger = logging.getLogger(__name__)
 
 
+EMOTION_TAG_RE = re.compile(r'\[(\w+)\]')
+EMOTION_SEGMENT_RE = re.compile(r'\[(\w+)\]\s*([^\[]+)')
+SENTENCE_END_RE = re.compile(r'[.!?]\s*$')
+
+
 class StreamingEmotionParser:
     """
     Parses emotion tags from streaming LLM token stream
@@ -64,7 +69,7 @@ class StreamingEmotionParser:
 
         if self.state == "ACCUMULATING":
 
-            tag_match = re.search(r'\[(\w+)\]', self.buffer)
+            tag_match = EMOTION_TAG_RE.search(self.buffer)
             if tag_match:
                 emotion = tag_match.group(1).lower()
 
@@ -119,7 +124,7 @@ class StreamingEmotionParser:
             True if segment is ready
         """
 
-        if re.search(r'[.!?]\s*$', self.current_text):
+        if SENTENCE_END_RE.search(self.current_text):
             return True
 
 
@@ -194,7 +199,8 @@ class ConversationManager:
         config: dict,
         emotion_engine=None,
         user_memory=None,
-        conversation_history=None
+        conversation_history=None,
+        llm: Optional[OllamaClient] = None
     ):
         """
         Initialize conversation manager
@@ -204,6 +210,7 @@ class ConversationManager:
             emotion_engine: Optional EmotionEngine instance
             user_memory: Optional UserMemory instance
             conversation_history: Optional ConversationHistory instance
+            llm: Optional shared OllamaClient (avoids a second availability probe)
         """
         self.config = config
         self.emotion_engine = emotion_engine
@@ -211,7 +218,7 @@ class ConversationManager:
         self.conversation_history_db = conversation_history
 
 
-        self.llm = OllamaClient(config)
+        self.llm = llm if llm is not None else OllamaClient(config)
 
 
         self.context_window = config.get('memory', {}).get('conversation', {}).get('context_window', 10)
@@ -229,6 +236,16 @@ class ConversationManager:
         self.session_id = self._generate_session_id()
 
 
+        # Running totals so the summary never rescans the history
+        self._stats = {'tokens': 0, 'emotions': Counter()}
+
+
+        # Ollama KV-cache context carried between turns; dropped once the
+        # session grows past the text context window so prompts stay bounded
+        self.llm_session_context: Optional[List[int]] = None
+        self.llm_session_turns = 0
+
+
         self.max_response_length = 240
         self.response_filters = [
             self._ensure_short,
@@ -273,17 +290,24 @@ class ConversationManager:
         start_time = time.time()
 
 
-        formatted_context = self._format_context_for_llm()
+        if self.llm_session_context:
+            formatted_context = None
+        else:
+            formatted_context = self._format_context_for_llm()
 
         result = self.llm.generate_with_personality(
             user_input=user_text,
             user_name=self.current_user_name,
-            context=formatted_context
+            context=formatted_context,
+            session_context=self.llm_session_context
         )
 
         response_time = time.time() - start_time
 
 
+        self._update_session_context(result.get('context'))
+
+
         raw_response = result.get('response', '')
         emotion_segments = self._parse_emotion_segments(raw_response)
 
@@ -331,6 +355,8 @@ class ConversationManager:
 
 
         self.message_count += 1
+        self._stats['tokens'] += result.get('tokens', 0)
+        self._stats['emotions'][final_emotion] += 1
 
 
         current_energy = self._get_current_energy()
@@ -342,6 +368,7 @@ class ConversationManager:
             'energy': current_energy,
             'response_time': response_time,
             'tokens': result.get('tokens', 0),
+            'prompt_tokens': result.get('prompt_tokens', 0),
             'model': result.get('model', 'unknown'),
             'message_count': self.message_count,
             'fallback': result.get('fallback', False)
@@ -382,9 +409,7 @@ class ConversationManager:
             self._update_user_name()
 
 
-        system_prompt = self.llm.personality_template.format(
-            user_name=self.current_user_name
-        )
+        system_prompt = self.llm.render_personality_prompt(self.current_user_name)
 
 
         streaming_config = self.config.get('llm', {}).get('streaming', {})
@@ -405,10 +430,14 @@ class ConversationManager:
 
         all_segments = []
         segment_count = 0
+        token_count = 0
 
         try:
 
+            # Ollama streams one token per chunk, so the chunk count stands in
+            # for the eval_count the non-streaming path reports
             for token in self.llm.stream_generate(user_text, system_prompt=system_prompt, context=formatted_context):
+                token_count += 1
 
                 segments = parser.add_token(token)
 
@@ -438,10 +467,11 @@ class ConversationManager:
 
             combined_text = ' '.join(text for _, text in all_segments)
             self._add_to_history('user', user_text)
-            self._add_to_history('assistant', combined_text)
+            self._add_to_history('assistant', combined_text, tokens=token_count)
 
 
             self._update_context(user_text, combined_text)
+            self.reset_session()
 
 
             if self.emotion_engine and all_segments:
@@ -458,14 +488,37 @@ class ConversationManager:
 
 
             self.message_count += 1
+            self._stats['tokens'] += token_count
+            if all_segments:
+                self._stats['emotions'][all_segments[-1][0]] += 1
 
-            logger.info(f"Streaming complete: {segment_count} segments generated")
+            logger.info(f"Streaming complete: {segment_count} segments, {token_count} tokens")
 
         except Exception as e:
             logger.error(f"Error in streaming generation: {e}", exc_info=True)
 
             yield ('happy', "Sorry, I had trouble with that.")
 
+    def _update_session_context(self, session_context: Optional[List[int]]):
+        """
+        Store Ollama context tokens for KV-cache reuse on the next turn
+
+        Args:
+            session_context: 'context' returned by Ollama, or None on fallback
+        """
+        self.llm_session_turns += 1
+
+        if not session_context or self.llm_session_turns * 2 > self.context_window:
+            self.reset_session()
+            return
+
+        self.llm_session_context = session_context
+
+    def reset_session(self):
+        """Drop cached Ollama context so the next turn re-sends text context"""
+        self.llm_session_context = None
+        self.llm_session_turns = 0
+
     def _build_context(self) -> List[str]:
         """
         Build conversation context for LLM
@@ -619,18 +672,12 @@ class ConversationManager:
 
 
 
-        pattern = r'\[(\w+)\]\s*([^\[]+)'
-        matches = re.findall(pattern, response)
-
-        if not matches:
-
-            logger.warning("No emotion tags found in response, using default 'happy'")
-            return [('happy', response)]
-
         segments = []
-        for emotion_raw, text in matches:
-            emotion = emotion_raw.lower().strip()
-            text = text.strip()
+        matched = False
+        for match in EMOTION_SEGMENT_RE.finditer(response):
+            matched = True
+            emotion = match[1].lower()
+            text = match[2].strip()
 
 
             if not text:
@@ -643,6 +690,11 @@ class ConversationManager:
 
             segments.append((emotion, text))
 
+        if not matched:
+
+            logger.warning("No emotion tags found in response, using default 'happy'")
+            return [('happy', response)]
+
         if not segments:
 
             logger.warning("All emotion segments were empty, using default")
@@ -771,6 +823,10 @@ class ConversationManager:
         summary = f"Conversation Summary:\n"
         summary += f"  Duration: {duration_min:.1f} minutes\n"
         summary += f"  Messages: {self.message_count}\n"
+        summary += f"  Tokens: {self._stats['tokens']}\n"
+        if self._stats['emotions']:
+            top = ', '.join(f"{e} ({n})" for e, n in self._stats['emotions'].most_common(3))
+            summary += f"  Top emotions: {top}\n"
         summary += f"  Current emotion: {self._get_current_emotion()}\n"
         summary += f"  User: {self.current_user_name}\n"
 
@@ -796,13 +852,16 @@ class ConversationManager:
     def clear_context(self):
         """Clear conversation context (but keep history)"""
         self.current_context.clear()
+        self.reset_session()
         logger.info("Conversation context cleared")
 
     def clear_history(self):
         """Clear all conversation history"""
         self.conversation_history.clear()
         self.current_context.clear()
+        self.reset_session()
         self.message_count = 0
+        self._stats = {'tokens': 0, 'emotions': Counter()}
         self.conversation_start_time = time.time()
         logger.info("Conversation history cleared")
 
@@ -6,13 +6,51 @@ Interface for Ollama LLM API optimized for Raspberry Pi
 import requests
 import json
 import logging
+import threading
 import time
-from typing import Dict, Optional, Iterator, List
+from string import Formatter
+from typing import Callable, Dict, Optional, Iterator, List
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 
+def compile_personality_template(template: str) -> Callable[[str], str]:
+    """
+    Pre-parse the personality prompt into a renderer for user_name
+
+    A template whose only field is a plain {user_name} is split once into
+    its literal chunks and rendered with a single str.join; anything else
+    falls back to str.format.
+
+    Args:
+        template: Personality prompt using str.format syntax
+
+    Returns:
+        Function mapping user_name to the rendered prompt
+    """
+    def fallback(user_name: str) -> str:
+        return template.format(user_name=user_name)
+
+    try:
+        parsed = list(Formatter().parse(template))
+    except ValueError:
+        return fallback
+
+    chunks = ['']
+    for literal, field, spec, conversion in parsed:
+        chunks[-1] += literal
+
+        if field is None:
+            continue
+        if field != 'user_name' or spec or conversion:
+            return fallback
+
+        chunks.append('')
+
+    return lambda user_name: str(user_name).join(chunks)
+
+
 class OllamaClient:
     """Client for interacting with Ollama LLM API"""
 
@@ -40,6 +78,7 @@ class OllamaClient:
 
 
         self.personality_template = self.llm_config['personality_prompt']
+        self.render_personality_prompt = compile_personality_template(self.personality_template)
         self.fallback_responses = self.llm_config['fallback_responses']
 
 
@@ -47,6 +86,11 @@ class OllamaClient:
         self.total_tokens = 0
         self.total_time = 0.0
         self.last_response_time = 0.0
+        self._stats_lock = threading.Lock()
+
+
+        # requests.Session is not thread-safe; keep one per thread
+        self._local = threading.local()
 
 
         self.is_available = self._check_availability()
@@ -56,6 +100,15 @@ class OllamaClient:
         else:
             logger.warning(f"Ollama not available at {self.base_url}, will use fallback responses")
 
+    @property
+    def session(self) -> requests.Session:
+        """Per-thread HTTP session (keeps the connection to Ollama alive)"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+        return session
+
     def _check_availability(self) -> bool:
         """
         Check if Ollama service is running
@@ -64,7 +117,7 @@ class OllamaClient:
             True if available, False otherwise
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/tags",
                 timeout=2.0
             )
@@ -89,7 +142,8 @@ class OllamaClient:
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
-        context: Optional[List[str]] = None
+        context: Optional[List[str]] = None,
+        session_context: Optional[List[int]] = None
     ) -> Dict[str, any]:
         """
         Generate response from LLM
@@ -98,9 +152,12 @@ class OllamaClient:
             prompt: User prompt
             system_prompt: Optional system prompt (overrides personality)
             context: Optional conversation context
+            session_context: Optional Ollama 'context' tokens from the previous
+                turn; lets Ollama reuse its KV cache instead of re-prefilling
 
         Returns:
-            Dictionary with 'response', 'tokens', 'duration'
+            Dictionary with 'response', 'tokens', 'duration', and the
+            'context' tokens to pass back on the next turn
         """
         if not self.is_available:
             return self._get_fallback_response(prompt)
@@ -127,7 +184,10 @@ class OllamaClient:
             if system_prompt:
                 payload['system'] = system_prompt
 
-            response = requests.post(
+            if session_context:
+                payload['context'] = session_context
+
+            response = self.session.post(
                 f"{self.base_url}/api/generate",
                 json=payload,
                 timeout=self.timeout
@@ -142,18 +202,21 @@ class OllamaClient:
 
 
             duration = time.time() - start_time
-            self.total_requests += 1
-            self.total_tokens += tokens
-            self.total_time += duration
-            self.last_response_time = duration
+            with self._stats_lock:
+                self.total_requests += 1
+                self.total_tokens += tokens
+                self.total_time += duration
+                self.last_response_time = duration
 
             logger.info(f"Generated response in {duration:.2f}s ({tokens} tokens)")
 
             return {
                 'response': generated_text,
                 'tokens': tokens,
+                'prompt_tokens': result.get('prompt_eval_count', 0),
                 'duration': duration,
-                'model': self.model
+                'model': self.model,
+                'context': result.get('context')
             }
 
         except requests.exceptions.Timeout:
@@ -168,7 +231,8 @@ class OllamaClient:
         self,
         user_input: str,
         user_name: str = "friend",
-        context: Optional[List[str]] = None
+        context: Optional[List[str]] = None,
+        session_context: Optional[List[int]] = None
     ) -> Dict[str, any]:
         """
         Generate response with personality
@@ -178,16 +242,20 @@ class OllamaClient:
             user_input: User's message
             user_name: User's name
             context: Optional conversation history
+            session_context: Optional Ollama context tokens from the previous turn
 
         Returns:
             Dictionary with response (format: "[emotion] message") and metadata
         """
 
-        system_prompt = self.personality_template.format(
-            user_name=user_name
-        )
+        system_prompt = self.render_personality_prompt(user_name)
 
-        return self.generate(user_input, system_prompt=system_prompt, context=context)
+        return self.generate(
+            user_input,
+            system_prompt=system_prompt,
+            context=context,
+            session_context=session_context
+        )
 
     def stream_generate(
         self,
@@ -232,7 +300,7 @@ class OllamaClient:
             if system_prompt:
                 payload['system'] = system_prompt
 
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/generate",
                 json=payload,
                 stream=True,
@@ -314,6 +382,40 @@ class OllamaClient:
         """
         return self._check_availability()
 
+    def warmup(self, keep_alive: str = "30m") -> bool:
+        """
+        Load the model into memory ahead of the first real request
+
+        Sends a prompt-less generate request, which makes Ollama load the
+        weights and keep them resident for keep_alive.
+
+        Args:
+            keep_alive: How long Ollama should keep the model loaded
+
+        Returns:
+            True if the model was loaded
+        """
+        if not self.is_available:
+            return False
+
+        try:
+            response = self.session.post(
+                f"{self.base_url}/api/generate",
+                json={'model': self.model, 'keep_alive': keep_alive},
+                timeout=self.timeout
+            )
+
+            if response.status_code == 200:
+                logger.info(f"Model '{self.model}' warmed up (keep_alive={keep_alive})")
+                return True
+
+            logger.warning(f"Warmup failed: HTTP {response.status_code}")
+
+        except Exception as e:
+            logger.error(f"Error warming up model: {e}")
+
+        return False
+
     def get_model_info(self) -> Optional[Dict]:
         """
         Get information about the loaded model
@@ -325,7 +427,7 @@ class OllamaClient:
             return None
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/show",
                 json={'name': self.model},
                 timeout=5.0
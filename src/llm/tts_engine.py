@@ -3,8 +3,14 @@ TTS Engine
 Text-to-Speech with emotion-based voice modulation
 """
 
+import hashlib
 import logging
+import os
+import queue
+import shutil
 import sys
+import threading
+from concurrent.futures import Future
 from pathlib import Path
 from typing import Optional, Dict
 
@@ -78,6 +84,19 @@ class TTSEngine:
         self.total_utterances = 0
         self.total_duration = 0.0
 
+
+        cache_dir = self.tts_config.get('cache_dir')
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+
+        self._voice_lock = threading.Lock()
+        self._synth_queue = queue.Queue()
+        self._play_queue = queue.Queue(maxsize=2)
+        self._pipeline_threads = []
+        self._closed = False
+
         logger.info(f"TTS Engine initialized with {self.provider}")
 
     def speak(
@@ -100,17 +119,11 @@ class TTSEngine:
 
         try:
 
-            if emotion and emotion in self.emotion_modulations:
-                self._set_emotion_voice(emotion)
-            else:
-                self._reset_voice()
-
-
-            self.tts.speak(text, wait=wait)
-
-
-            self.total_utterances += 1
-            logger.info(f"Speaking ({emotion or 'neutral'}): {text[:50]}...")
+            # The pipeline sets the voice under _voice_lock, so a direct
+            # speak() cannot retune the engine in the middle of a queued render
+            future = self.speak_async(text, emotion)
+            if wait:
+                future.result()
 
         except Exception as e:
             logger.error(f"TTS error: {e}")
@@ -147,52 +160,241 @@ class TTSEngine:
             logger.warning("Empty segments list, skipping TTS")
             return
 
-        try:
-            import time
+        logger.info(f"Speaking {len(segments)} emotion segment(s)")
 
-            logger.info(f"Speaking {len(segments)} emotion segment(s)")
+        for i, (emotion, text) in enumerate(segments):
+            if not text or not text.strip():
+                continue
 
-            for i, (emotion, text) in enumerate(segments):
-                if not text or not text.strip():
-                    continue
+            self.speak_async(text, emotion)
+            logger.debug(f"Segment {i+1}/{len(segments)}: ({emotion}) {text[:30]}...")
 
+        if wait:
+            self.join()
+            logger.info(f"Completed speaking {len(segments)} segment(s)")
 
-                if emotion and emotion in self.emotion_modulations:
-                    self._set_emotion_voice(emotion)
-                else:
-                    self._reset_voice()
+    def speak_async(
+        self,
+        text: str,
+        emotion: Optional[str] = None,
+        pause_after: float = 0.0
+    ) -> Future:
+        """
+        Queue text for pipelined synthesis and playback (non-blocking)
+
+        A synthesis thread renders the next phrase while the playback
+        thread is still playing the current one.
+
+        Args:
+            text: Text to speak
+            emotion: Optional emotion for voice modulation
+            pause_after: Seconds of silence played after the phrase
+
+        Returns:
+            Future resolved once the phrase has finished playing
+        """
+        future = Future()
 
+        if not text or not text.strip():
+            logger.warning("Empty text, skipping TTS")
+            future.set_result(None)
+            return future
 
-                self.tts.speak(text, wait=True)
+        self._start_pipeline()
+        self._synth_queue.put((text, emotion, pause_after, future))
 
+        return future
 
+    def join(self):
+        """Block until every phrase queued with speak_async has been played"""
+        self._synth_queue.join()
+        self._play_queue.join()
 
-                if i < len(segments) - 1:
-                    time.sleep(0.05)
+    def _start_pipeline(self):
+        """Start the synthesis and playback threads if not running"""
+        if self._pipeline_threads:
+            return
 
+        for target in (self._synth_worker, self._play_worker):
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            self._pipeline_threads.append(thread)
 
-                self.total_utterances += 1
+    def _synth_worker(self):
+        """Pipeline stage 1: synthesize queued phrases to WAV files"""
+        while True:
+            item = self._synth_queue.get()
 
-                logger.debug(f"Segment {i+1}/{len(segments)}: ({emotion}) {text[:30]}...")
+            if item is None:
+                self._play_queue.put(None)
+                self._synth_queue.task_done()
+                break
 
-            logger.info(f"Completed speaking {len(segments)} segment(s)")
+            text, emotion, pause_after, future = item
 
-        except Exception as e:
-            logger.error(f"Error in segmented TTS: {e}")
+            try:
+                if not future.set_running_or_notify_cancel():
+                    continue
+
+                wav_path = self.synthesize(text, emotion)
+
+                if wav_path is None:
+                    future.set_exception(RuntimeError("TTS synthesis failed"))
+                    continue
 
-    def speak_async(self, text: str, emotion: Optional[str] = None):
+                logger.info(f"Speaking ({emotion or 'neutral'}): {text[:50]}...")
+
+                self._play_queue.put((wav_path, pause_after, future))
+
+            except Exception as e:
+                logger.error(f"TTS synthesis error: {e}")
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self._synth_queue.task_done()
+
+    def _play_worker(self):
+        """Pipeline stage 2: play synthesized WAV files in order"""
+        while True:
+            item = self._play_queue.get()
+
+            if item is None:
+                self._play_queue.task_done()
+                break
+
+            wav_path, pause_after, future = item
+
+            try:
+                self.play(wav_path)
+                if pause_after > 0:
+                    self.tts.play_silence(pause_after)
+                future.set_result(wav_path)
+            except Exception as e:
+                logger.error(f"TTS playback error: {e}")
+                future.set_exception(e)
+            finally:
+                self._play_queue.task_done()
+
+    def synthesize(self, text: str, emotion: Optional[str] = None) -> Optional[Path]:
         """
-        Speak asynchronously (non-blocking)
+        Render text with emotion modulation to a WAV file
+
+        When speech.tts.cache_dir is configured, renders are kept there
+        keyed by text, emotion and voice settings, so repeated phrases are
+        only synthesized once. Safe to call from several threads: Piper
+        renders run in parallel, pyttsx3 renders are serialized.
 
         Args:
-            text: Text to speak
+            text: Text to synthesize
             emotion: Optional emotion for voice modulation
+
+        Returns:
+            Path to the WAV file, or None if synthesis failed
         """
-        self.speak(text, emotion=emotion, wait=False)
+        cache_path = None
+        if self.cache_dir:
+            cache_path = self.cache_dir / f"{self._cache_key(text, emotion)}.wav"
+            if cache_path.exists():
+                logger.debug(f"TTS cache hit: {cache_path.name}")
+                return cache_path
+
+        modulation = self.emotion_modulations.get(emotion) if emotion else None
+
+        if self.tts.provider_name == 'piper':
+            length_scale = 1.0 / modulation['rate_mult'] if modulation else 1.0
+            wav_path = self.tts.synthesize(text, length_scale=length_scale)
+        else:
+            with self._voice_lock:
+                if modulation:
+                    self._set_emotion_voice(emotion)
+                else:
+                    self._reset_voice()
+
+                wav_path = self.tts.synthesize(text)
+
+        if wav_path is None or cache_path is None:
+            return wav_path
+
+        # Renders land in tmpfs, usually another filesystem than the cache,
+        # so the move may be a copy; it goes under the render's unique name
+        # first so a concurrent cache hit never sees a partial file
+        staged = cache_path.with_name(wav_path.name)
+        try:
+            shutil.move(str(wav_path), str(staged))
+            os.replace(staged, cache_path)
+            return cache_path
+        except OSError as e:
+            logger.warning(f"Could not cache TTS output: {e}")
+            if staged.exists() and not wav_path.exists():
+                return staged
+            return wav_path
+
+    def play(self, wav_path: Path):
+        """
+        Play a WAV file from synthesize() and wait for it to finish
+
+        Args:
+            wav_path: Rendered utterance
+        """
+        self.tts.play_file(wav_path, wait=True, keep=self._is_cached(wav_path))
+        self.total_utterances += 1
+
+    def _cache_key(self, text: str, emotion: Optional[str]) -> str:
+        """
+        Build the cache key for a rendered utterance
+
+        Args:
+            text: Text to synthesize
+            emotion: Emotion used for modulation
+
+        Returns:
+            Hex digest identifying text and voice settings
+        """
+        voice = self.tts_config.get(self.provider, {})
+        modulation = self.emotion_modulations.get(emotion) if emotion else None
+
+        key = repr((
+            self.provider,
+            voice.get('model_path', voice.get('voice_id')),
+            self.base_rate,
+            self.base_volume,
+            sorted(modulation.items()) if modulation else None,
+            text
+        ))
+
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+    def _is_cached(self, wav_path: Path) -> bool:
+        """Check whether a WAV file belongs to the synthesis cache"""
+        return self.cache_dir is not None and wav_path.parent == self.cache_dir
+
+    def _drain_pipeline(self):
+        """Drop phrases that have not started playing yet"""
+        for q in (self._synth_queue, self._play_queue):
+            while True:
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+
+                if item is not None:
+                    future = item[-1]
+                    if not future.cancel() and not future.done():
+                        future.set_result(None)
+
+                    # Play items carry a rendered WAV that will never be played
+                    if q is self._play_queue and not self._is_cached(item[0]):
+                        try:
+                            item[0].unlink()
+                        except OSError:
+                            pass
+
+                q.task_done()
 
     def stop_speaking(self):
         """Stop current speech"""
         try:
+            self._drain_pipeline()
             self.tts.stop_speaking()
             logger.info("Speech stopped")
         except Exception as e:
@@ -283,9 +485,9 @@ class TTSEngine:
 
         for emotion in self.emotion_modulations.keys():
             print(f"\nTesting {emotion} voice...")
-            self.speak(test_phrase, emotion=emotion, wait=True)
-            import time
-            time.sleep(0.5)
+            self.speak_async(test_phrase, emotion, pause_after=0.5)
+
+        self.join()
 
     def get_statistics(self) -> Dict:
         """
@@ -302,8 +504,18 @@ class TTSEngine:
         }
 
     def cleanup(self):
-        """Clean up TTS resources"""
-        self.stop_speaking()
+        """Clean up TTS resources (safe to call more than once)"""
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._pipeline_threads:
+            self._drain_pipeline()
+            self._synth_queue.put(None)
+            for thread in self._pipeline_threads:
+                thread.join(timeout=2.0)
+            self._pipeline_threads = []
+
         self.tts.cleanup()
         logger.info("TTS Engine cleanup complete")
 
@@ -359,9 +571,9 @@ if __name__ == "__main__":
 
     for emotion in emotions_to_test:
         print(f"\n   Testing {emotion}...")
-        tts.speak(f"I feel {emotion}!", emotion=emotion, wait=True)
-        import time
-        time.sleep(0.3)
+        tts.speak_async(f"I feel {emotion}!", emotion, pause_after=0.3)
+
+    tts.join()
 
 
     print("\n3. Testing stop...")
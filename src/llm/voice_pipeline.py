@@ -50,9 +50,11 @@ class VoicePipeline:
         self.is_running = False
         self.is_listening = False
         self.pipeline_thread: Optional[threading.Thread] = None
+        self.stt_thread: Optional[threading.Thread] = None
 
 
         self.transcription_queue = queue.Queue()
+        self._stt_queue: queue.Queue = queue.Queue(maxsize=2)
 
 
         self.on_transcription: Optional[Callable[[Dict], None]] = None
@@ -82,6 +84,8 @@ class VoicePipeline:
 
 
         self.is_running = True
+        self.stt_thread = threading.Thread(target=self._stt_loop, daemon=True)
+        self.stt_thread.start()
         self.pipeline_thread = threading.Thread(target=self._pipeline_loop, daemon=True)
         self.pipeline_thread.start()
 
@@ -99,6 +103,13 @@ class VoicePipeline:
         if self.pipeline_thread:
             self.pipeline_thread.join(timeout=2.0)
 
+        if self.stt_thread:
+            try:
+                self._stt_queue.put(None, timeout=2.0)
+            except queue.Full:
+                pass
+            self.stt_thread.join(timeout=2.0)
+
         self.audio_input.stop_listening()
 
         logger.info("Voice pipeline stopped")
@@ -149,13 +160,7 @@ class VoicePipeline:
                     continue
 
 
-                audio_chunk = None
-                if not self.audio_input.level_queue.empty():
-                    audio_chunk = self.audio_input.level_queue.get(timeout=0.1)
-
-                if audio_chunk is None:
-                    time.sleep(0.01)
-                    continue
+                audio_chunk = self.audio_input.level_queue.get(timeout=0.5)
 
 
                 has_voice = self.vad.detect(audio_chunk)
@@ -189,7 +194,7 @@ class VoicePipeline:
                             self.on_speech_end()
 
 
-                        self._process_audio_buffer(audio_buffer)
+                        self._stt_queue.put(audio_buffer)
 
 
                         speech_detected = False
@@ -204,6 +209,21 @@ class VoicePipeline:
 
         logger.info("Pipeline loop ended")
 
+    def _stt_loop(self):
+        """
+        Transcribe finished utterances off the capture thread
+
+        Capture keeps feeding the VAD while Whisper works on the previous
+        utterance; the bounded queue stops a slow STT backend from piling
+        up audio buffers.
+        """
+        while True:
+            audio_buffer = self._stt_queue.get()
+            if audio_buffer is None:
+                break
+
+            self._process_audio_buffer(audio_buffer)
+
     def _process_audio_buffer(self, audio_buffer: list):
         """
         Process recorded audio buffer through STT
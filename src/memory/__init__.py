@@ -10,19 +10,22 @@ from .conversation_history import ConversationHistory
 __all__ = ['Database', 'UserMemory', 'ConversationHistory', 'initialize_memory']
 
 
-def initialize_memory(config: dict):
+def initialize_memory(config: dict, db_path_override: str = None, connection=None):
     """
     Initialize memory system with database
 
     Args:
         config: Configuration dictionary from settings.yaml
+        db_path_override: Optional database path used instead of the config value
+        connection: Optional open sqlite3.Connection to share instead of
+            opening the database file per query
 
     Returns:
         Tuple of (user_memory, conversation_history) instances
     """
-    db_path = config.get('memory', {}).get('database_path', 'data/companion.db')
+    db_path = db_path_override or config.get('memory', {}).get('database_path', 'data/companion.db')
 
-    database = Database(db_path)
+    database = Database(db_path, connection=connection)
 
     user_memory = UserMemory(database)
     conversation_history = ConversationHistory(database)
@@ -70,7 +70,7 @@ class ConversationHistory:
         messages: List[Dict]
     ) -> int:
         """
-        Save multiple conversation messages
+        Save multiple conversation messages in a single transaction
 
         Args:
             user_id: User ID
@@ -81,17 +81,19 @@ class ConversationHistory:
         Returns:
             Number of messages saved
         """
-        count = 0
-        for msg in messages:
-            self.save_message(
-                user_id=user_id,
-                session_id=session_id,
-                role=msg['role'],
-                message=msg['message'],
-                emotion=msg.get('emotion'),
-                tokens=msg.get('tokens', 0)
-            )
-            count += 1
+        query = '''
+            INSERT INTO conversations
+            (user_id, session_id, role, message, emotion, tokens)
+            VALUES (?, ?, ?, ?, ?, ?)
+        '''
+
+        rows = [
+            (user_id, session_id, msg['role'], msg['message'],
+             msg.get('emotion'), msg.get('tokens', 0))
+            for msg in messages
+        ]
+
+        count = self.db.execute_many(query, rows) if rows else 0
 
         logger.info(f"Saved {count} messages for session {session_id}")
         return count
@@ -233,6 +235,9 @@ class ConversationHistory:
         Returns:
             List of matching message dictionaries
         """
+        if self.db.fts_enabled and search_term.strip():
+            return self._search_fts(search_term, user_id, limit)
+
         if user_id:
             query = '''
                 SELECT conversation_id, session_id, role, message, timestamp
@@ -254,6 +259,42 @@ class ConversationHistory:
 
         return self.db.execute_query(query, params)
 
+    def _search_fts(
+        self,
+        search_term: str,
+        user_id: Optional[int],
+        limit: int
+    ) -> List[Dict]:
+        """
+        Search conversations through the FTS5 index, best matches first
+
+        Args:
+            search_term: Text to search for (matched as a phrase)
+            user_id: Optional user ID filter
+            limit: Maximum results
+
+        Returns:
+            List of matching message dictionaries
+        """
+        phrase = '"' + search_term.replace('"', '""') + '"'
+
+        query = '''
+            SELECT c.conversation_id, c.session_id, c.role, c.message, c.timestamp
+            FROM conversations_fts f
+            JOIN conversations c ON c.conversation_id = f.rowid
+            WHERE conversations_fts MATCH ?
+        '''
+        params = [phrase]
+
+        if user_id:
+            query += ' AND c.user_id = ?'
+            params.append(user_id)
+
+        query += ' ORDER BY f.rank LIMIT ?'
+        params.append(limit)
+
+        return self.db.execute_query(query, tuple(params))
+
     def get_conversation_stats(self, user_id: Optional[int] = None) -> Dict:
         """
         Get conversation statistics
@@ -6,6 +6,7 @@ Manages SQLite database for user profiles and conversation history
 import sqlite3
 import logging
 import json
+import threading
 from pathlib import Path
 from typing import Optional, Dict, List, Any
 from contextlib import contextmanager
@@ -16,39 +17,91 @@ logger = logging.getLogger(__name__)
 class Database:
     """SQLite database manager for companion bot memory"""
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, connection: Optional[sqlite3.Connection] = None):
         """
         Initialize database connection
 
         Args:
             db_path: Path to SQLite database file
+            connection: Optional already-open connection to use for every
+                query instead of reopening db_path (e.g. an in-memory copy)
         """
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.fts_enabled = False
+
+        if connection is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = self._connect(self.db_path)
+
+        connection.row_factory = sqlite3.Row
+        self._conn = connection
+        self._lock = threading.RLock()
+        self._tx_depth = 0
 
         self._init_database()
 
         logger.info(f"Database initialized at {self.db_path}")
 
+    @staticmethod
+    def _connect(db_path: Path) -> sqlite3.Connection:
+        """
+        Open the long-lived connection used for every query
+
+        The connection runs in autocommit mode so transactions are only
+        the explicit ones started by get_connection().
+
+        Args:
+            db_path: Path to SQLite database file
+
+        Returns:
+            sqlite3.Connection
+        """
+        conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+
+        # WAL persists in the database file; with synchronous=NORMAL a
+        # commit no longer waits on an fsync of the main database
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA mmap_size=268435456')
+
+        return conn
+
     @contextmanager
     def get_connection(self):
         """
-        Context manager for database connections
+        Context manager for a transaction on the shared connection
+
+        Nested uses join the outermost transaction, so several writes can
+        be grouped into one commit.
 
         Yields:
             sqlite3.Connection
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"Database error: {e}")
-            raise
-        finally:
-            conn.close()
+        with self._lock:
+            conn = self._conn
+            outermost = self._tx_depth == 0
+
+            if outermost and not conn.in_transaction:
+                conn.execute('BEGIN')
+
+            self._tx_depth += 1
+            try:
+                yield conn
+                if outermost:
+                    conn.commit()
+            except Exception as e:
+                if outermost:
+                    conn.rollback()
+                logger.error(f"Database error: {e}")
+                raise
+            finally:
+                self._tx_depth -= 1
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
 
     def _init_database(self):
         """Initialize database schema if not exists"""
@@ -120,8 +173,75 @@ class Database:
                 ON conversations(timestamp)
             ''')
 
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_interactions_user_type
+                ON interactions(user_id, interaction_type)
+            ''')
+
+            self.fts_enabled = self._init_fts(cursor)
+
             logger.info("Database schema initialized")
 
+    def _init_fts(self, cursor: sqlite3.Cursor) -> bool:
+        """
+        Create the FTS5 index over conversation messages
+
+        Args:
+            cursor: Cursor inside the schema transaction
+
+        Returns:
+            True if full-text search is available
+        """
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'conversations_fts'"
+        )
+        exists = cursor.fetchone() is not None
+
+        try:
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS conversations_fts USING fts5(
+                    message,
+                    content='conversations',
+                    content_rowid='conversation_id',
+                    tokenize='porter unicode61'
+                )
+            ''')
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5 unavailable, falling back to LIKE search: {e}")
+            return False
+
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS conversations_fts_insert
+            AFTER INSERT ON conversations BEGIN
+                INSERT INTO conversations_fts(rowid, message)
+                VALUES (new.conversation_id, new.message);
+            END
+        ''')
+
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS conversations_fts_delete
+            AFTER DELETE ON conversations BEGIN
+                INSERT INTO conversations_fts(conversations_fts, rowid, message)
+                VALUES ('delete', old.conversation_id, old.message);
+            END
+        ''')
+
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS conversations_fts_update
+            AFTER UPDATE OF message ON conversations BEGIN
+                INSERT INTO conversations_fts(conversations_fts, rowid, message)
+                VALUES ('delete', old.conversation_id, old.message);
+                INSERT INTO conversations_fts(rowid, message)
+                VALUES (new.conversation_id, new.message);
+            END
+        ''')
+
+        if not exists:
+            # Index rows written before the FTS table existed
+            cursor.execute("INSERT INTO conversations_fts(conversations_fts) VALUES ('rebuild')")
+
+        return True
+
     def execute_query(
         self,
         query: str,
@@ -166,6 +286,22 @@ class Database:
             cursor.execute(query, params)
             return cursor.lastrowid
 
+    def execute_many(self, query: str, params_seq: List[tuple]) -> int:
+        """
+        Execute a query once per parameter tuple inside a single transaction
+
+        Args:
+            query: SQL query string
+            params_seq: Sequence of parameter tuples
+
+        Returns:
+            Number of rows affected
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(query, params_seq)
+            return cursor.rowcount
+
     def cleanup_old_data(self, days: int = 90) -> int:
         """
         Delete conversations older than specified days
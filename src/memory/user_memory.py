@@ -25,6 +25,10 @@ class UserMemory:
             database: Database instance
         """
         self.db = database
+
+        # user_id -> {preference_key: preference_value}, filled on first read
+        self._pref_cache: Dict[int, Dict[str, str]] = {}
+
         logger.info("UserMemory initialized")
 
     def create_user(self, name: str, face_encoding: Optional[bytes] = None) -> int:
@@ -45,6 +49,7 @@ class UserMemory:
 
         metadata = json.dumps({'created_via': 'api'})
         user_id = self.db.execute_insert(query, (name, face_encoding, metadata))
+        self._pref_cache.pop(user_id, None)
 
         logger.info(f"Created user: {name} (ID: {user_id})")
         return user_id
@@ -150,6 +155,7 @@ class UserMemory:
 
         try:
             self.db.execute_query(query, (user_id,))
+            self._pref_cache.pop(user_id, None)
             logger.info(f"Deleted user ID: {user_id}")
             return True
         except Exception as e:
@@ -181,6 +187,9 @@ class UserMemory:
 
         try:
             self.db.execute_query(query, (user_id, key, value))
+            cached = self._pref_cache.get(user_id)
+            if cached is not None:
+                cached[key] = value
             logger.debug(f"Set preference for user {user_id}: {key}={value}")
             return True
         except Exception as e:
@@ -204,14 +213,7 @@ class UserMemory:
         Returns:
             Preference value or default
         """
-        query = '''
-            SELECT preference_value
-            FROM preferences
-            WHERE user_id = ? AND preference_key = ?
-        '''
-
-        result = self.db.execute_query(query, (user_id, key), fetch_one=True)
-        return result['preference_value'] if result else default
+        return self._load_preferences(user_id).get(key, default)
 
     def get_all_preferences(self, user_id: int) -> Dict[str, str]:
         """
@@ -223,6 +225,22 @@ class UserMemory:
         Returns:
             Dictionary of preferences
         """
+        return dict(self._load_preferences(user_id))
+
+    def _load_preferences(self, user_id: int) -> Dict[str, str]:
+        """
+        Get the cached preferences for a user, fetching them in one query on miss
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Cached preference dictionary (do not mutate)
+        """
+        cached = self._pref_cache.get(user_id)
+        if cached is not None:
+            return cached
+
         query = '''
             SELECT preference_key, preference_value
             FROM preferences
@@ -230,7 +248,9 @@ class UserMemory:
         '''
 
         results = self.db.execute_query(query, (user_id,))
-        return {row['preference_key']: row['preference_value'] for row in results}
+        cached = {row['preference_key']: row['preference_value'] for row in results}
+        self._pref_cache[user_id] = cached
+        return cached
 
     def delete_preference(self, user_id: int, key: str) -> bool:
         """
@@ -250,6 +270,9 @@ class UserMemory:
 
         try:
             self.db.execute_query(query, (user_id, key))
+            cached = self._pref_cache.get(user_id)
+            if cached is not None:
+                cached.pop(key, None)
             return True
         except Exception as e:
             logger.error(f"Error deleting preference: {e}")
@@ -0,0 +1,117 @@
+"""
+TTS Test Fixtures
+Shared phrases and a reusable TTSEngine for the TTS test scripts
+"""
+
+import functools
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Dict, Final, List, Tuple
+
+
+EMOTIONS: Final[Tuple[Tuple[str, str], ...]] = (
+    ('happy', "I'm so happy to see you!"),
+    ('excited', "This is so exciting!"),
+    ('sad', "I feel sad when you're away."),
+    ('sleepy', "I'm feeling so sleepy..."),
+    ('angry', "I'm angry about this!"),
+    ('scared', "That was scary!"),
+    ('loving', "I love you so much!"),
+    ('playful', "Let's play together!"),
+    ('curious', "I wonder what that is?"),
+    ('lonely', "I'm feeling lonely."),
+    ('bored', "This is boring."),
+    ('surprised', "Wow! What a surprise!"),
+)
+
+MULTI_SEGMENTS: Final[Tuple[Tuple[str, str], ...]] = (
+    ('happy', "Hi there! I'm glad to see you!"),
+    ('curious', "What have you been up to?"),
+    ('excited', "I can't wait to hear about it!"),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class TTSSettings:
+    """TTS settings shown by the test scripts, resolved once from the config"""
+
+    provider: str = 'pyttsx3'
+    rate: int = 150
+    volume: float = 0.9
+    pitch: float = 1.5
+
+    @classmethod
+    def from_config(cls, config: dict) -> 'TTSSettings':
+        """
+        Build settings from settings.yaml, keeping defaults for missing keys
+
+        Args:
+            config: Configuration dictionary from settings.yaml
+
+        Returns:
+            TTSSettings instance
+        """
+        tts_config = config.get('speech', {}).get('tts', {})
+        voice = tts_config.get('pyttsx3', {})
+
+        values = {key: voice[key] for key in ('rate', 'volume', 'pitch') if key in voice}
+        if 'provider' in tts_config:
+            values['provider'] = tts_config['provider']
+
+        return cls(**values)
+
+
+_configs_by_key: Dict[str, dict] = {}
+_engines: List = []
+
+
+def tts_config_key(config: dict) -> str:
+    """
+    Hash the TTS section of the config
+
+    Args:
+        config: Configuration dictionary from settings.yaml
+
+    Returns:
+        Hex digest identifying the TTS settings
+    """
+    tts_config = config.get('speech', {}).get('tts', {})
+    encoded = json.dumps(tts_config, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha1(encoded).hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_tts(config_key: str):
+    from llm.tts_engine import TTSEngine
+
+    tts = TTSEngine(_configs_by_key[config_key])
+    _engines.append(tts)
+    return tts
+
+
+def get_tts(config: dict):
+    """
+    Get a TTSEngine for the config, reusing a warm one when possible
+
+    Scripts that run several TTS tests in one process share a single
+    engine instead of bringing the TTS driver up per test.
+
+    Args:
+        config: Configuration dictionary from settings.yaml
+
+    Returns:
+        TTSEngine instance
+    """
+    key = tts_config_key(config)
+    _configs_by_key[key] = config
+    return _get_tts(key)
+
+
+def release_tts():
+    """Clean up every TTSEngine handed out by get_tts()"""
+    _get_tts.cache_clear()
+    _configs_by_key.clear()
+
+    while _engines:
+        _engines.pop().cleanup()
@@ -13,7 +13,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
-import yaml
+from config_loader import load_config as load_settings
 from expression import EmotionDisplay
 
 
@@ -25,6 +25,15 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+BANNER = "=" * 70
+RULE = "─" * 70
+
+
+def _header(title):
+    """Print a demo section header"""
+    print(f"\n{BANNER}\n{title}\n{BANNER}")
+
+
 def load_config():
     """Load configuration from settings.yaml"""
     config_path = Path(__file__).parent.parent / 'config' / 'settings.yaml'
@@ -34,8 +43,7 @@ def load_config():
         sys.exit(1)
 
     try:
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+        config = load_settings(config_path)
         logger.info("Configuration loaded")
         return config
     except Exception as e:
@@ -105,12 +113,10 @@ def demo_listening_state(display: EmotionDisplay):
 
 def main():
     """Main demo function"""
-    print("\n" + "="*70)
-    print("🎭 EMOTION EXPRESSION PIPELINE DEMO")
-    print("="*70)
+    _header("🎭 EMOTION EXPRESSION PIPELINE DEMO")
     print("\nThis demo cycles through emotions with smooth transitions.")
     print("Press GPIO pin 27 to exit (or Ctrl+C)")
-    print("─" * 70)
+    print(RULE)
 
 
     config = load_config()
@@ -189,14 +195,12 @@ def main():
         print("✅ Cleanup complete")
 
 
-    print("\n" + "="*70)
-    print("DEMO SUMMARY")
-    print("="*70)
+    _header("DEMO SUMMARY")
     print("✅ All emotion transitions demonstrated")
     print("✅ Speaking animation tested")
     print("✅ Listening state tested")
     print("\nThe expression pipeline is ready for integration!")
-    print("="*70 + "\n")
+    print(BANNER + "\n")
 
     return 0
 
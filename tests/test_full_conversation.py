@@ -14,7 +14,7 @@ from datetime import datetime
 
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
-import yaml
+from config_loader import load_config
 from llm import ConversationPipeline
 
 
@@ -26,6 +26,15 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+BANNER = "=" * 80
+RULE = "─" * 80
+
+
+def _header(title):
+    """Print a demo section header"""
+    print(f"\n{BANNER}\n{title}\n{BANNER}")
+
+
 class FullConversationDemo:
     """Interactive full conversation demo with visual feedback"""
 
@@ -70,10 +79,10 @@ class FullConversationDemo:
 
     def print_header(self):
         """Print demo header"""
-        print("\n" + "=" * 80)
+        print(f"\n{BANNER}")
         print("🗣️  FULL CONVERSATION DEMO".center(80))
         print("Voice → Whisper STT → Ollama LLM → TTS → Speech".center(80))
-        print("=" * 80)
+        print(BANNER)
 
     def _check_prerequisites(self) -> bool:
         """Check if all systems are ready"""
@@ -134,9 +143,7 @@ class FullConversationDemo:
 
     def print_troubleshooting(self):
         """Print troubleshooting tips"""
-        print("\n" + "=" * 80)
-        print("🔧 TROUBLESHOOTING")
-        print("=" * 80)
+        _header("🔧 TROUBLESHOOTING")
 
         print("\nMicrophone issues:")
         print("  • Check connection: arecord -l")
@@ -152,7 +159,7 @@ class FullConversationDemo:
         print("  • Check speaker: aplay /usr/share/sounds/alsa/Front_Center.wav")
         print("  • Install espeak: sudo apt-get install espeak")
 
-        print("=" * 80)
+        print(BANNER)
 
     def on_listening(self):
         """Called when user starts speaking"""
@@ -195,15 +202,13 @@ class FullConversationDemo:
 
     def on_complete(self):
         """Called when full cycle completes"""
-        print("─" * 80)
+        print(RULE)
 
     def print_summary(self):
         """Print session summary"""
         stats = self.pipeline.get_statistics()
 
-        print("\n" + "=" * 80)
-        print("📊 SESSION SUMMARY".center(80))
-        print("=" * 80)
+        _header("📊 SESSION SUMMARY".center(80))
 
         print(f"\n💬 Conversation Statistics:")
         print(f"   Total conversations: {stats['conversations']}")
@@ -239,9 +244,7 @@ class FullConversationDemo:
 
                 print(f"   [{time_str}] {role_icon} {entry['text'][:60]}{emotion_str}")
 
-        print("\n" + "=" * 80)
-        print("✅ Demo completed successfully!".center(80))
-        print("=" * 80)
+        _header("✅ Demo completed successfully!".center(80))
 
     def run(self):
         """Run the demo"""
@@ -265,9 +268,7 @@ class FullConversationDemo:
 
 def main():
     """Main entry point"""
-    print("\n" + "=" * 80)
-    print("🤖 FULL CONVERSATION DEMO - Voice-to-Voice AI")
-    print("=" * 80)
+    _header("🤖 FULL CONVERSATION DEMO - Voice-to-Voice AI")
 
 
     config_path = Path(__file__).parent.parent / 'config' / 'settings.yaml'
@@ -278,8 +279,7 @@ def main():
         return 1
 
     try:
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+        config = load_config(config_path)
         print("✅ Configuration loaded")
     except Exception as e:
         print(f"❌ Failed to load config: {e}")
@@ -4,16 +4,20 @@ LLM Integration Test Script
 Test Ollama integration and conversation without voice
 """
 
+import io
 import sys
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
-import yaml
-from llm import OllamaClient, ConversationManager, TTSEngine
+from config_loader import load_config
+from llm import OllamaClient, ConversationManager
+from _tts_fixtures import get_tts, release_tts
 
 
 logging.basicConfig(
@@ -24,13 +28,91 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def test_ollama_connection(config):
+BANNER = "=" * 70
+RULE = "─" * 70
+
+
+def _header(title):
+    """Print a test section header"""
+    print(f"\n{BANNER}\n{title}\n{BANNER}")
+
+
+class _GroupOutput(io.TextIOBase):
+    """stdout proxy that gives each test-group thread its own buffer"""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def capture(self) -> io.StringIO:
+        self._local.buf = io.StringIO()
+        return self._local.buf
+
+    def release(self):
+        self._local.buf = None
+
+    def write(self, text):
+        buf = getattr(self._local, 'buf', None)
+        return (buf or self._stream).write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+
+def _run_tests(tests, config, ctx):
+    """
+    Run tests sequentially, printing straight to stdout
+
+    Args:
+        tests: List of (test_name, test_func) tuples
+        config: Configuration dictionary
+        ctx: Shared test context
+
+    Returns:
+        List of (test_name, result) tuples
+    """
+    results = []
+
+    for test_name, test_func in tests:
+        try:
+            result = test_func(config, ctx)
+            results.append((test_name, result))
+        except Exception as e:
+            print(f"\n❌ Test failed with error: {e}")
+            logger.error("Test error", exc_info=True)
+            results.append((test_name, False))
+
+    return results
+
+
+def _run_group(tests, config, ctx, out):
+    """
+    Run a group of tests sequentially, buffering their output
+
+    Args:
+        tests: List of (test_name, test_func) tuples
+        config: Configuration dictionary
+        ctx: Shared test context
+        out: _GroupOutput installed as sys.stdout
+
+    Returns:
+        Tuple of (results, captured_output)
+    """
+    buf = out.capture()
+
+    try:
+        results = _run_tests(tests, config, ctx)
+    finally:
+        out.release()
+
+    return results, buf.getvalue()
+
+
+def test_ollama_connection(config, ctx):
     """Test basic Ollama connection"""
-    print("\n" + "="*70)
-    print("TEST 1: Ollama Connection")
-    print("="*70)
+    _header("TEST 1: Ollama Connection")
 
-    client = OllamaClient(config)
+    client = ctx['client']
 
     if client.is_available:
         print("✅ Ollama is running and available")
@@ -50,35 +132,45 @@ def test_ollama_connection(config):
         return False
 
 
-def test_text_generation(config):
+def test_text_generation(config, ctx):
     """Test basic text generation"""
-    print("\n" + "="*70)
-    print("TEST 2: Text Generation")
-    print("="*70)
+    _header("TEST 2: Text Generation")
 
-    client = OllamaClient(config)
+    client = ctx['client']
 
     if not client.is_available:
         print("⏭️  Skipping (Ollama not available)")
         return False
 
     print("\nGenerating response...")
-    result = client.generate("Say hello in one short sentence!")
+    print("\n📝 Response: ", end='', flush=True)
 
-    print(f"\n📝 Response: {result['response']}")
-    print(f"⏱️  Time: {result['duration']:.2f}s")
-    print(f"📊 Tokens: {result['tokens']}")
+    start_time = time.time()
+    first_token_time = None
+    token_count = 0
+
+    for token in client.stream_generate("Say hello in one short sentence!"):
+        if first_token_time is None:
+            first_token_time = time.time() - start_time
+        token_count += 1
+        sys.stdout.write(token)
+        sys.stdout.flush()
+
+    duration = time.time() - start_time
+
+    print()
+    print(f"⚡ Time to first token: {first_token_time or 0.0:.2f}s")
+    print(f"⏱️  Time: {duration:.2f}s")
+    print(f"📊 Tokens: {token_count}")
 
     return True
 
 
-def test_personality_prompts(config):
+def test_personality_prompts(config, ctx):
     """Test personality-aware generation"""
-    print("\n" + "="*70)
-    print("TEST 3: Personality Prompts")
-    print("="*70)
+    _header("TEST 3: Personality Prompts")
 
-    client = OllamaClient(config)
+    client = ctx['client']
 
     if not client.is_available:
         print("⏭️  Skipping (Ollama not available)")
@@ -91,22 +183,29 @@ def test_personality_prompts(config):
         ("Tell me something interesting", "should express curious emotion"),
     ]
 
-    for prompt, expected_behavior in test_prompts:
+    with ThreadPoolExecutor(max_workers=len(test_prompts)) as executor:
+        futures = [
+            executor.submit(
+                client.generate_with_personality,
+                user_input=prompt,
+                user_name="friend"
+            )
+            for prompt, _ in test_prompts
+        ]
+
+    for (prompt, expected_behavior), future in zip(test_prompts, futures):
         print(f"\n💬 Testing: '{prompt}'")
         print(f"   Expected: {expected_behavior}")
 
-        result = client.generate_with_personality(
-            user_input=prompt,
-            user_name="friend"
-        )
+        result = future.result()
 
         response = result['response']
         print(f"   Response: {response}")
 
 
-        if response.startswith('[') and ']' in response:
-            emotion_end = response.index(']')
-            emotion = response[1:emotion_end]
+        head, sep, _ = response.partition(']')
+        if sep and head.startswith('['):
+            emotion = head[1:]
             print(f"   ✅ LLM chose emotion: {emotion}")
         else:
             print("   ⚠️  No emotion tag detected in response")
@@ -114,13 +213,12 @@ def test_personality_prompts(config):
     return True
 
 
-def test_conversation_manager(config):
+def test_conversation_manager(config, ctx):
     """Test conversation manager with context"""
-    print("\n" + "="*70)
-    print("TEST 4: Conversation Manager")
-    print("="*70)
+    _header("TEST 4: Conversation Manager")
 
-    manager = ConversationManager(config)
+    manager = ctx['manager']
+    manager.clear_history()
 
     if not manager.llm.is_available:
         print("⏭️  Skipping (Ollama not available)")
@@ -134,32 +232,36 @@ def test_conversation_manager(config):
 
     print("\nHaving a conversation...\n")
 
+    prompt_tokens = []
+
     for i, msg in enumerate(conversation, 1):
         print(f"[{i}] 👤 You: {msg}")
 
         response, metadata = manager.process_user_input(msg)
+        prompt_tokens.append(metadata.get('prompt_tokens', 0))
 
         print(f"    🤖 Bot ({metadata['emotion']}): {response}")
         print(f"    ⏱️  {metadata['response_time']:.2f}s | "
               f"🎭 {metadata['emotion']} | "
               f"⚡ {metadata['energy']:.0%}\n")
 
-        time.sleep(0.5)
 
+    if all(tokens < prompt_tokens[0] for tokens in prompt_tokens[1:]):
+        print(f"✅ KV cache reused (prompt tokens per turn: {prompt_tokens})")
+    else:
+        print(f"⚠️  Prompt re-prefilled each turn (prompt tokens: {prompt_tokens})")
 
-    print("─" * 70)
+    print(RULE)
     print(manager.get_conversation_summary())
 
     return True
 
 
-def test_tts_engine(config):
+def test_tts_engine(config, ctx):
     """Test TTS with emotions"""
-    print("\n" + "="*70)
-    print("TEST 5: TTS Engine")
-    print("="*70)
+    _header("TEST 5: TTS Engine")
 
-    tts = TTSEngine(config)
+    tts = get_tts(config)
 
     print("\nAvailable voices:")
     voices = tts.get_available_voices()
@@ -173,24 +275,22 @@ def test_tts_engine(config):
 
     for emotion in emotions_to_test:
         print(f"\n   🎵 Speaking with '{emotion}' emotion...")
-        tts.speak(test_phrase, emotion=emotion, wait=True)
-        time.sleep(0.3)
+        tts.speak_async(test_phrase, emotion)
 
-    tts.cleanup()
+    tts.join()
     print("\n✅ TTS test complete")
 
     return True
 
 
-def interactive_mode(config):
+def interactive_mode(config, ctx):
     """Interactive conversation mode"""
-    print("\n" + "="*70)
-    print("INTERACTIVE MODE")
-    print("="*70)
+    _header("INTERACTIVE MODE")
     print("\nType your messages (or 'quit' to exit)")
-    print("─" * 70)
+    print(RULE)
 
-    manager = ConversationManager(config)
+    manager = ctx['manager']
+    manager.clear_history()
 
     if not manager.llm.is_available:
         print("❌ Ollama not available - cannot run interactive mode")
@@ -208,6 +308,7 @@ def interactive_mode(config):
 
             if user_input.lower() in ['quit', 'exit', 'bye']:
                 print("\n👋 Goodbye!")
+                manager.reset_session()
                 break
 
 
@@ -227,19 +328,18 @@ def interactive_mode(config):
         print("\n\n👋 Goodbye!")
 
 
-    print("\n" + "─" * 70)
+    print(f"\n{RULE}")
     print(manager.get_conversation_summary())
 
     return True
 
 
-def test_emotion_segments(config):
+def test_emotion_segments(config, ctx):
     """Test that metadata includes emotion_segments for multi-emotion responses"""
-    print("\n" + "="*70)
-    print("TEST 6: Emotion Segments in Metadata")
-    print("="*70)
+    _header("TEST 6: Emotion Segments in Metadata")
 
-    manager = ConversationManager(config)
+    manager = ctx['manager']
+    manager.clear_history()
 
     if not manager.llm.is_available:
         print("⏭️  Skipping (Ollama not available)")
@@ -276,13 +376,11 @@ def test_emotion_segments(config):
     return True
 
 
-def test_segmented_tts(config):
+def test_segmented_tts(config, ctx):
     """Test segmented TTS with multiple emotions"""
-    print("\n" + "="*70)
-    print("TEST 7: Segmented TTS")
-    print("="*70)
+    _header("TEST 7: Segmented TTS")
 
-    tts = TTSEngine(config)
+    tts = get_tts(config)
 
     segments = [
         ("excited", "Hello friend!"),
@@ -304,9 +402,7 @@ def test_segmented_tts(config):
 
 def main():
     """Main test function"""
-    print("\n" + "="*70)
-    print("🤖 LLM INTEGRATION TEST SUITE")
-    print("="*70)
+    _header("🤖 LLM INTEGRATION TEST SUITE")
 
 
     config_path = Path(__file__).parent.parent / 'config' / 'settings.yaml'
@@ -317,42 +413,69 @@ def main():
         return 1
 
     try:
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+        config = load_config(config_path)
         print("✅ Configuration loaded")
     except Exception as e:
         print(f"❌ Failed to load config: {e}")
         return 1
 
 
-    tests = [
+    client = OllamaClient(config)
+    if client.is_available:
+        client.warmup()
+
+    ctx = {
+        'client': client,
+        'manager': ConversationManager(config, llm=client),
+    }
+
+
+    # Streaming output is the point of the text generation test, so it runs
+    # first and unbuffered, before the groups below are captured
+    group_live = [
         ("Ollama Connection", test_ollama_connection),
         ("Text Generation", test_text_generation),
+    ]
+
+    # Ollama tests share the client and manager, so they stay sequential;
+    # the TTS tests only touch the audio device and can overlap with them
+    group_ollama = [
         ("Personality Prompts", test_personality_prompts),
         ("Conversation Manager", test_conversation_manager),
-        ("TTS Engine", test_tts_engine),
         ("Emotion Segments", test_emotion_segments),
+    ]
+    group_tts = [
+        ("TTS Engine", test_tts_engine),
         ("Segmented TTS", test_segmented_tts),
     ]
 
     results = []
+    stdout = sys.stdout
+    out = _GroupOutput(stdout)
 
-    for test_name, test_func in tests:
-        try:
-            result = test_func(config)
-            results.append((test_name, result))
-        except KeyboardInterrupt:
-            print("\n\n⏹️  Tests interrupted")
-            return 1
-        except Exception as e:
-            print(f"\n❌ Test failed with error: {e}")
-            logger.error("Test error", exc_info=True)
-            results.append((test_name, False))
+    try:
+        results.extend(_run_tests(group_live, config, ctx))
+
+        sys.stdout = out
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(_run_group, group, config, ctx, out)
+                for group in (group_ollama, group_tts)
+            ]
+
+            for future in futures:
+                group_results, output = future.result()
+                out.write(output)
+                results.extend(group_results)
+    except KeyboardInterrupt:
+        print("\n\n⏹️  Tests interrupted")
+        return 1
+    finally:
+        sys.stdout = stdout
+        release_tts()
 
 
-    print("\n" + "="*70)
-    print("TEST SUMMARY")
-    print("="*70)
+    _header("TEST SUMMARY")
 
     passed = sum(1 for _, result in results if result)
     total = len(results)
@@ -365,10 +488,10 @@ def main():
 
 
     if passed > 0:
-        print("\n" + "="*70)
+        print(f"\n{BANNER}")
         response = input("\nRun interactive mode? (y/n): ").strip().lower()
         if response == 'y':
-            interactive_mode(config)
+            interactive_mode(config, ctx)
 
     print("\n✅ All tests complete!")
     return 0
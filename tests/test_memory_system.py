@@ -6,12 +6,13 @@ Test user profiles, conversation persistence, and database functionality
 
 import sys
 import logging
+import sqlite3
 from pathlib import Path
 
 
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
-import yaml
+from config_loader import load_config
 from memory import initialize_memory
 
 
@@ -23,11 +24,17 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+BANNER = "=" * 70
+
+
+def _header(title):
+    """Print a test section header"""
+    print(f"\n{BANNER}\n{title}\n{BANNER}")
+
+
 def test_user_profiles(user_memory):
     """Test user profile management"""
-    print("\n" + "="*70)
-    print("TEST 1: User Profile Management")
-    print("="*70)
+    _header("TEST 1: User Profile Management")
 
 
     print("\n📝 Creating test users...")
@@ -57,9 +64,7 @@ def test_user_profiles(user_memory):
 
 def test_preferences(user_memory, user_id):
     """Test user preferences"""
-    print("\n" + "="*70)
-    print("TEST 2: User Preferences")
-    print("="*70)
+    _header("TEST 2: User Preferences")
 
 
     print("\n📝 Setting preferences...")
@@ -84,82 +89,87 @@ def test_preferences(user_memory, user_id):
 
 def test_interactions(user_memory, user_id):
     """Test interaction logging"""
-    print("\n" + "="*70)
-    print("TEST 3: Interaction Logging")
-    print("="*70)
+    buf = []
+    p = buf.append
 
+    p(f"\n{BANNER}\nTEST 3: Interaction Logging\n{BANNER}")
 
-    print("\n📝 Recording interactions...")
-    user_memory.record_interaction(user_id, "voice", "Hello!", "happy")
-    user_memory.record_interaction(user_id, "touch", "head", "excited")
-    user_memory.record_interaction(user_id, "voice", "How are you?", "curious")
-    print("   Recorded 3 interactions")
 
+    p("\n📝 Recording interactions...")
+    with user_memory.db.get_connection():
+        user_memory.record_interaction(user_id, "voice", "Hello!", "happy")
+        user_memory.record_interaction(user_id, "touch", "head", "excited")
+        user_memory.record_interaction(user_id, "voice", "How are you?", "curious")
+    p("   Recorded 3 interactions")
 
-    print("\n📋 Interaction history:")
+
+    p("\n📋 Interaction history:")
     history = user_memory.get_interaction_history(user_id, limit=10)
     for interaction in history:
-        print(f"   [{interaction['timestamp']}] {interaction['interaction_type']}: "
-              f"{interaction['interaction_value']} → {interaction['emotion_response']}")
+        p(f"   [{interaction['timestamp']}] {interaction['interaction_type']}: "
+          f"{interaction['interaction_value']} → {interaction['emotion_response']}")
 
 
-    print("\n📊 Interaction stats:")
+    p("\n📊 Interaction stats:")
     stats = user_memory.get_interaction_stats(user_id)
     for interaction_type, count in stats.items():
-        print(f"   {interaction_type}: {count}")
+        p(f"   {interaction_type}: {count}")
 
-    print("\n✅ Interaction tests passed")
+    p("\n✅ Interaction tests passed")
+    sys.stdout.write("\n".join(buf) + "\n")
 
 
 def test_conversation_persistence(conversation_history, user_id):
     """Test conversation persistence"""
-    print("\n" + "="*70)
-    print("TEST 4: Conversation Persistence")
-    print("="*70)
+    buf = []
+    p = buf.append
+
+    p(f"\n{BANNER}\nTEST 4: Conversation Persistence\n{BANNER}")
 
 
     session_id = conversation_history.generate_session_id()
-    print(f"\n📝 Session ID: {session_id}")
+    p(f"\n📝 Session ID: {session_id}")
 
 
-    print("\n💬 Saving conversation...")
-    conversation_history.save_message(user_id, session_id, "user", "Hello!")
-    conversation_history.save_message(user_id, session_id, "assistant", "Hi! How are you?", emotion="happy", tokens=5)
-    conversation_history.save_message(user_id, session_id, "user", "I'm great, thanks!")
-    conversation_history.save_message(user_id, session_id, "assistant", "That's wonderful!", emotion="excited", tokens=3)
-    print("   Saved 4 messages")
+    p("\n💬 Saving conversation...")
+    saved = conversation_history.save_conversation_batch(user_id, session_id, [
+        {'role': "user", 'message': "Hello!"},
+        {'role': "assistant", 'message': "Hi! How are you?", 'emotion': "happy", 'tokens': 5},
+        {'role': "user", 'message': "I'm great, thanks!"},
+        {'role': "assistant", 'message': "That's wonderful!", 'emotion': "excited", 'tokens': 3},
+    ])
+    p(f"   Saved {saved} messages")
 
 
-    print("\n📋 Session conversation:")
+    p("\n📋 Session conversation:")
     messages = conversation_history.get_session_conversation(session_id)
     for msg in messages:
         emotion_str = f" ({msg['emotion']})" if msg['emotion'] else ""
-        print(f"   {msg['role']}: {msg['message']}{emotion_str}")
+        p(f"   {msg['role']}: {msg['message']}{emotion_str}")
 
 
-    print("\n📋 User's recent conversations:")
+    p("\n📋 User's recent conversations:")
     recent = conversation_history.get_user_conversations(user_id, limit=5)
     for msg in recent:
-        print(f"   [{msg['session_id'][:8]}...] {msg['role']}: {msg['message'][:40]}...")
+        p(f"   [{msg['session_id'][:8]}...] {msg['role']}: {msg['message'][:40]}...")
 
 
-    print("\n📊 Conversation stats:")
+    p("\n📊 Conversation stats:")
     stats = conversation_history.get_conversation_stats(user_id)
-    print(f"   Total messages: {stats['total_messages']}")
-    print(f"   Total sessions: {stats['total_sessions']}")
-    print(f"   Avg messages/session: {stats['avg_messages_per_session']:.1f}")
+    p(f"   Total messages: {stats['total_messages']}")
+    p(f"   Total sessions: {stats['total_sessions']}")
+    p(f"   Avg messages/session: {stats['avg_messages_per_session']:.1f}")
     if stats.get('top_emotions'):
-        print(f"   Top emotions: {stats['top_emotions']}")
+        p(f"   Top emotions: {stats['top_emotions']}")
 
-    print("\n✅ Conversation persistence tests passed")
+    p("\n✅ Conversation persistence tests passed")
+    sys.stdout.write("\n".join(buf) + "\n")
     return session_id
 
 
 def test_search(conversation_history):
     """Test conversation search"""
-    print("\n" + "="*70)
-    print("TEST 5: Conversation Search")
-    print("="*70)
+    _header("TEST 5: Conversation Search")
 
 
     print("\n🔍 Searching for 'great'...")
@@ -173,14 +183,11 @@ def test_search(conversation_history):
 
 def test_memory_persistence():
     """Test that memory persists across instances"""
-    print("\n" + "="*70)
-    print("TEST 6: Memory Persistence")
-    print("="*70)
+    _header("TEST 6: Memory Persistence")
 
 
     config_path = Path(__file__).parent.parent / 'config' / 'settings.yaml'
-    with open(config_path) as f:
-        config = yaml.safe_load(f)
+    config = load_config(config_path)
 
 
     print("\n📝 Creating first memory instance...")
@@ -193,7 +200,17 @@ def test_memory_persistence():
 
 
     print("\n🔄 Creating second memory instance (simulating restart)...")
-    user_memory2, conv_history2 = initialize_memory(config)
+    db_path = config.get('memory', {}).get('database_path', 'data/companion.db')
+    src_conn = sqlite3.connect(db_path)
+    mem_conn = sqlite3.connect(':memory:')
+    try:
+        src_conn.backup(mem_conn)
+    finally:
+        src_conn.close()
+
+    user_memory2, conv_history2 = initialize_memory(
+        config, db_path_override=':memory:', connection=mem_conn
+    )
 
 
     print("\n🔍 Checking if data persists...")
@@ -211,14 +228,13 @@ def test_memory_persistence():
     else:
         print(f"   ❌ User not found after restart")
 
+    mem_conn.close()
     print("\n✅ Persistence tests passed")
 
 
 def test_cleanup(conversation_history):
     """Test cleanup functionality"""
-    print("\n" + "="*70)
-    print("TEST 7: Database Cleanup")
-    print("="*70)
+    _header("TEST 7: Database Cleanup")
 
     print("\n🗑️  Testing cleanup (0 days - should delete nothing recent)...")
     deleted = conversation_history.cleanup_old_conversations(days=0)
@@ -229,9 +245,7 @@ def test_cleanup(conversation_history):
 
 def main():
     """Main test function"""
-    print("\n" + "="*70)
-    print("🧠 MEMORY SYSTEM TEST SUITE")
-    print("="*70)
+    _header("🧠 MEMORY SYSTEM TEST SUITE")
 
 
     config_path = Path(__file__).parent.parent / 'config' / 'settings.yaml'
@@ -242,8 +256,7 @@ def main():
         return 1
 
     try:
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+        config = load_config(config_path)
         print("✅ Configuration loaded")
     except Exception as e:
         print(f"❌ Failed to load config: {e}")
@@ -291,9 +304,7 @@ def main():
         return 1
 
 
-    print("\n" + "="*70)
-    print("TEST SUMMARY")
-    print("="*70)
+    _header("TEST SUMMARY")
     print("✅ All memory system tests passed!")
     print("\n💾 Database location:", config.get('memory', {}).get('database_path', 'data/companion.db'))
 
@@ -4,15 +4,25 @@ TTS Hardware Test Script
 Tests TTS output with wm8960-soundcard and all emotion voices
 """
 
+import array
+import math
 import sys
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
-import yaml
-from llm.tts_engine import TTSEngine
+from config_loader import load_config
+from _tts_fixtures import EMOTIONS, MULTI_SEGMENTS, TTSSettings, get_tts, release_tts
+
+try:
+    import sounddevice as sd
+    SOUNDDEVICE_AVAILABLE = True
+except (ImportError, OSError):
+    SOUNDDEVICE_AVAILABLE = False
 
 
 logging.basicConfig(
@@ -23,37 +33,69 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+TTS_CACHE_DIR = Path(__file__).parent.parent / 'data' / 'tts_cache'
+
+MAX_CONSECUTIVE_FAILURES = 2
+
+BANNER = "=" * 70
+
+
+def _header(title):
+    """Print a test section header"""
+    print(f"\n{BANNER}\n{title}\n{BANNER}")
+
+
+def _play_test_tone(freq: int = 1000, duration: float = 0.5, sample_rate: int = 22050):
+    """Play a sine tone straight to the default output device"""
+    samples = array.array('h', (
+        int(12000 * math.sin(2 * math.pi * freq * i / sample_rate))
+        for i in range(int(duration * sample_rate))
+    ))
+
+    with sd.RawOutputStream(samplerate=sample_rate, channels=1, dtype='int16', latency='low') as stream:
+        stream.write(samples.tobytes())
+
+
 def test_audio_device():
     """Display audio device information"""
-    print("\n" + "="*70)
-    print("AUDIO DEVICE INFORMATION")
-    print("="*70)
+    _header("AUDIO DEVICE INFORMATION")
 
     try:
         import subprocess
 
 
         print("\n📻 ALSA Playback Devices:")
-        result = subprocess.run(['aplay', '-l'], capture_output=True, text=True)
+        result = subprocess.run(['aplay', '-l'], capture_output=True)
         if result.returncode == 0:
-            print(result.stdout)
+            sys.stdout.flush()
+            sys.stdout.buffer.write(result.stdout)
+            sys.stdout.buffer.flush()
         else:
             print("   ⚠️  Could not list ALSA devices")
 
 
         print("\n🔊 Testing default audio device:")
         print("   Playing a brief test tone...")
-        result = subprocess.run(
-            ['speaker-test', '-t', 'wav', '-c', '2', '-l', '1'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
+        if SOUNDDEVICE_AVAILABLE:
+            _play_test_tone()
             print("   ✅ Audio playback successful!")
         else:
-            print("   ❌ Audio test failed")
-            print(result.stderr)
+            proc = subprocess.Popen(
+                ['speaker-test', '-t', 'wav', '-c', '2', '-l', '1'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
+            )
+            try:
+                _, stderr = proc.communicate(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                _, stderr = proc.communicate()
+
+            if proc.returncode == 0:
+                print("   ✅ Audio playback successful!")
+            else:
+                print("   ❌ Audio test failed")
+                print(stderr.decode(errors='replace'))
 
     except FileNotFoundError:
         print("   ⚠️  ALSA tools not found (install with: sudo apt install alsa-utils)")
@@ -63,22 +105,20 @@ def test_audio_device():
 
 def test_tts_engine(config):
     """Test TTS engine with basic speech"""
-    print("\n" + "="*70)
-    print("TTS ENGINE TEST")
-    print("="*70)
+    _header("TTS ENGINE TEST")
 
     try:
         print("\n📦 Initializing TTS engine...")
-        tts = TTSEngine(config)
+        tts = get_tts(config)
         print("   ✅ TTS engine initialized")
 
 
         print("\n⚙️  TTS Configuration:")
-        print(f"   Provider: {config.get('speech', {}).get('tts', {}).get('provider', 'pyttsx3')}")
-        tts_config = config.get('speech', {}).get('tts', {}).get('pyttsx3', {})
-        print(f"   Rate: {tts_config.get('rate', 150)} words/min")
-        print(f"   Volume: {tts_config.get('volume', 0.9)}")
-        print(f"   Pitch: {tts_config.get('pitch', 1.5)}")
+        settings = TTSSettings.from_config(config)
+        print(f"   Provider: {settings.provider}")
+        print(f"   Rate: {settings.rate} words/min")
+        print(f"   Volume: {settings.volume}")
+        print(f"   Pitch: {settings.pitch}")
 
 
         print("\n🔊 Testing basic speech:")
@@ -96,61 +136,64 @@ def test_tts_engine(config):
 
 def test_emotion_voices(tts):
     """Test all emotion voices"""
-    print("\n" + "="*70)
-    print("EMOTION VOICE TEST")
-    print("="*70)
-    print("\nTesting all 12 emotion states...")
-    print("(Listen for rate, pitch, and volume changes)")
-    print("")
-
-    emotions_to_test = [
-        ('happy', "I'm so happy to see you!"),
-        ('excited', "This is so exciting!"),
-        ('sad', "I feel sad when you're away."),
-        ('sleepy', "I'm feeling so sleepy..."),
-        ('angry', "I'm angry about this!"),
-        ('scared', "That was scary!"),
-        ('loving', "I love you so much!"),
-        ('playful', "Let's play together!"),
-        ('curious', "I wonder what that is?"),
-        ('lonely', "I'm feeling lonely."),
-        ('bored', "This is boring."),
-        ('surprised', "Wow! What a surprise!"),
-    ]
-
-    for i, (emotion, text) in enumerate(emotions_to_test, 1):
-        print(f"[{i}/12] {emotion.upper():12s} - {text}")
-        try:
-            tts.speak_with_emotion(text, emotion, wait=True)
-        except Exception as e:
-            print(f"        ❌ Error: {e}")
+    sys.stdout.write(
+        f"\n{BANNER}\nEMOTION VOICE TEST\n{BANNER}\n"
+        "\nTesting all 12 emotion states...\n"
+        "(Listen for rate, pitch, and volume changes)\n\n"
+    )
+
+
+    # Render every phrase up front on a worker pool and play them back in
+    # order as each one becomes ready
+    failures = 0
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        renders = [
+            executor.submit(tts.synthesize, text, emotion)
+            for emotion, text in EMOTIONS
+        ]
+
+        for i, ((emotion, text), render) in enumerate(zip(EMOTIONS, renders), 1):
+            # One write per phrase, flushed before playback so nothing hits
+            # the console while the sound card is busy
+            sys.stdout.write(f"[{i}/{len(EMOTIONS)}] {emotion.upper():12s} - {text}\n")
+            sys.stdout.flush()
+            try:
+                wav_path = render.result()
+                if wav_path is None:
+                    raise RuntimeError("synthesis failed")
+                tts.play(wav_path)
+                failures = 0
+            except Exception as e:
+                sys.stdout.write(f"        ❌ Error: {e}\n")
+                failures += 1
+
+                if failures >= MAX_CONSECUTIVE_FAILURES:
+                    print(f"\n❌ {failures} failures in a row - giving up on emotion voices")
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    return False
 
     print("\n✅ All emotion voices tested")
+    return True
 
 
 def test_multi_emotion_speech(tts):
     """Test multi-emotion speech with transitions"""
-    print("\n" + "="*70)
-    print("MULTI-EMOTION SPEECH TEST")
-    print("="*70)
+    _header("MULTI-EMOTION SPEECH TEST")
     print("\nTesting emotion transitions within a single response...")
     print("")
 
 
-    segments = [
-        ('happy', "Hi there! I'm glad to see you!"),
-        ('curious', "What have you been up to?"),
-        ('excited', "I can't wait to hear about it!"),
-    ]
-
     print("Segments:")
-    for emotion, text in segments:
+    for emotion, text in MULTI_SEGMENTS:
         print(f"  [{emotion}] {text}")
 
     print("\n🔊 Speaking with emotion transitions...")
     try:
-        tts.speak_segments_with_emotions(segments, wait=True)
-        print("✅ Multi-emotion speech complete")
+        start = time.perf_counter()
+        tts.speak_segments_with_emotions(MULTI_SEGMENTS, wait=True)
+        elapsed = time.perf_counter() - start
+        print(f"✅ Multi-emotion speech complete ({elapsed:.2f}s, synthesis overlapped with playback)")
     except Exception as e:
         print(f"❌ Multi-emotion speech failed: {e}")
         logger.error("Multi-emotion speech error", exc_info=True)
@@ -158,9 +201,7 @@ def test_multi_emotion_speech(tts):
 
 def test_statistics(tts):
     """Display TTS statistics"""
-    print("\n" + "="*70)
-    print("TTS STATISTICS")
-    print("="*70)
+    _header("TTS STATISTICS")
 
     stats = tts.get_statistics()
     print(f"\n📊 Performance Stats:")
@@ -172,9 +213,7 @@ def test_statistics(tts):
 
 def main():
     """Main test function"""
-    print("\n" + "="*70)
-    print("🔊 TTS HARDWARE TEST - wm8960-soundcard")
-    print("="*70)
+    _header("🔊 TTS HARDWARE TEST - wm8960-soundcard")
     print("\nThis script tests TTS output with your audio hardware.")
     print("Make sure speakers are connected to the wm8960-soundcard.")
     print("")
@@ -188,14 +227,17 @@ def main():
         return 1
 
     try:
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+        config = load_config(config_path)
         print("✅ Configuration loaded")
     except Exception as e:
         print(f"❌ Failed to load config: {e}")
         return 1
 
 
+    # The test phrases never change, so keep their renders between runs
+    config['speech']['tts'].setdefault('cache_dir', str(TTS_CACHE_DIR))
+
+
     try:
 
         test_audio_device()
@@ -207,19 +249,20 @@ def main():
             return 1
 
 
-        test_emotion_voices(tts)
+        voices_ok = test_emotion_voices(tts)
 
+        if voices_ok:
 
-        test_multi_emotion_speech(tts)
+            test_multi_emotion_speech(tts)
 
 
-        test_statistics(tts)
+            test_statistics(tts)
+        else:
+            print("\n⏭️  Skipping remaining TTS tests (audio output is failing)")
 
 
-        print("\n" + "="*70)
-        print("CLEANUP")
-        print("="*70)
-        tts.cleanup()
+        _header("CLEANUP")
+        release_tts()
         print("✅ TTS engine cleanup complete")
 
     except KeyboardInterrupt:
@@ -232,9 +275,12 @@ def main():
         return 1
 
 
-    print("\n" + "="*70)
-    print("TEST SUMMARY")
-    print("="*70)
+    _header("TEST SUMMARY")
+
+    if not voices_ok:
+        print("\n❌ Emotion voice playback failed - check the speaker connection")
+        return 1
+
     print("\n✅ All TTS hardware tests complete!")
     print("\nIf you heard all the test phrases, your audio setup is working correctly.")
     print("The companion bot will now be able to speak using the wm8960-soundcard.")
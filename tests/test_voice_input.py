@@ -4,15 +4,18 @@ Voice Input Test Script
 Test mini microphone with Whisper STT
 """
 
+import functools
+import operator
 import sys
 import logging
-import time
+import signal
+import threading
 from pathlib import Path
 
 
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
-import yaml
+from config_loader import load_config
 from llm.voice_pipeline import VoicePipeline
 
 
@@ -24,11 +27,55 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+BANNER = "=" * 70
+
+
+def _header(title):
+    """Print a test section header"""
+    print(f"\n{BANNER}\n{title}\n{BANNER}")
+
+
+# Keys the pipeline reads, checked before any model is loaded
+_REQUIRED = (
+    ('audio', 'input', 'sample_rate'),
+    ('audio', 'input', 'channels'),
+    ('audio', 'input', 'chunk_size'),
+    ('audio', 'processing', 'vad_aggressiveness'),
+    ('audio', 'processing', 'silence_threshold'),
+    ('audio', 'processing', 'silence_duration'),
+    ('audio', 'processing', 'noise_reduction'),
+    ('speech', 'stt', 'whisper', 'model_size'),
+    ('speech', 'stt', 'whisper', 'device'),
+    ('speech', 'stt', 'language'),
+)
+
+
+def _missing_keys(config):
+    """
+    Find required config keys that are absent
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        List of dotted paths that could not be resolved
+    """
+    missing = []
+
+    for path in _REQUIRED:
+        try:
+            functools.reduce(operator.getitem, path, config)
+        except (KeyError, TypeError):
+            missing.append('.'.join(path))
+
+    return missing
+
+
 def main():
     """Main test function"""
-    print("=" * 70)
+    print(BANNER)
     print("🎤 Voice Input Test - Mini Microphone + Whisper")
-    print("=" * 70)
+    print(BANNER)
 
 
     config_path = Path(__file__).parent.parent / 'config' / 'settings.yaml'
@@ -39,8 +86,14 @@ def main():
         return 1
 
     print("\n📋 Loading configuration...")
-    with open(config_path) as f:
-        config = yaml.safe_load(f)
+    config = load_config(config_path)
+
+    missing = _missing_keys(config)
+    if missing:
+        print("❌ Config is missing required keys:")
+        for key in missing:
+            print(f"   {key}")
+        return 1
 
 
     print("\n🔧 Audio Configuration:")
@@ -81,14 +134,12 @@ def main():
         nonlocal transcription_count
         transcription_count += 1
 
-        print("\n" + "=" * 70)
-        print(f"📝 TRANSCRIPTION #{transcription_count}")
-        print("=" * 70)
+        _header(f"📝 TRANSCRIPTION #{transcription_count}")
         print(f"Text:       {result['text']}")
         print(f"Language:   {result['language']}")
         print(f"Confidence: {result['confidence']:.2%}")
         print(f"Duration:   {result['duration']:.2f}s")
-        print("=" * 70)
+        print(BANNER)
 
     def on_speech_start():
         print("\n🎤 [LISTENING] Speak now...")
@@ -101,23 +152,23 @@ def main():
 
 
     print("\n✅ Voice pipeline ready!")
-    print("\n" + "=" * 70)
+    print(f"\n{BANNER}")
     print("Instructions:")
     print("  1. Speak clearly into your mini microphone")
     print("  2. The system will detect when you start/stop speaking")
     print("  3. Wait for transcription results")
     print("  4. Press Ctrl+C to stop")
-    print("=" * 70)
+    print(BANNER)
     print("\n🎯 Starting voice recognition...\n")
 
+    stop_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+
     try:
         pipeline.start()
 
 
-        while True:
-            time.sleep(0.1)
-
-    except KeyboardInterrupt:
+        stop_event.wait()
         print("\n\n⏹️  Stopping voice pipeline...")
 
     finally:
@@ -126,14 +177,12 @@ def main():
 
         stats = pipeline.get_statistics()
 
-        print("\n" + "=" * 70)
-        print("📊 Session Statistics")
-        print("=" * 70)
+        _header("📊 Session Statistics")
         print(f"Total Utterances:         {stats['total_utterances']}")
         print(f"Total Transcription Time: {stats['total_transcription_time']:.2f}s")
         print(f"Avg Time per Utterance:   {stats['avg_transcription_time']:.2f}s")
         print(f"Last Transcription Time:  {stats['last_transcription_time']:.2f}s")
-        print("=" * 70)
+        print(BANNER)
 
         if stats['total_utterances'] > 0:
             print("\n✅ Test completed successfully!")
@@ -14,7 +14,7 @@ from datetime import datetime
 
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
-import yaml
+from config_loader import load_config
 from llm.voice_pipeline import VoicePipeline
 
 
@@ -26,6 +26,14 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+BANNER = "=" * 80
+
+
+def _header(title):
+    """Print a demo section header"""
+    print(f"\n{BANNER}\n{title}\n{BANNER}")
+
+
 class VoiceAssistantDemo:
     """Interactive voice assistant demo"""
 
@@ -75,10 +83,10 @@ class VoiceAssistantDemo:
 
     def print_header(self):
         """Print demo header"""
-        print("\n" + "=" * 80)
+        print(f"\n{BANNER}")
         print("🤖 VOICE ASSISTANT DEMO".center(80))
         print("Mini Microphone + OpenAI Whisper".center(80))
-        print("=" * 80)
+        print(BANNER)
 
     def print_instructions(self):
         """Print usage instructions"""
@@ -95,9 +103,7 @@ class VoiceAssistantDemo:
 
     def print_troubleshooting(self):
         """Print troubleshooting tips"""
-        print("\n" + "=" * 80)
-        print("Troubleshooting Tips:")
-        print("=" * 80)
+        _header("Troubleshooting Tips:")
         print("1. Check microphone connection:")
         print("   arecord -l")
         print("\n2. Test recording:")
@@ -106,7 +112,7 @@ class VoiceAssistantDemo:
         print("   alsamixer")
         print("\n4. Check config:")
         print("   config/settings.yaml")
-        print("=" * 80)
+        print(BANNER)
 
     def on_speech_start(self):
         """Called when speech is detected"""
@@ -205,9 +211,7 @@ class VoiceAssistantDemo:
         """Print session summary"""
         stats = self.pipeline.get_statistics()
 
-        print("\n" + "=" * 80)
-        print("📊 SESSION SUMMARY".center(80))
-        print("=" * 80)
+        _header("📊 SESSION SUMMARY".center(80))
 
         print(f"\n📈 Statistics:")
         print(f"   Total Utterances:         {stats['total_utterances']}")
@@ -231,9 +235,9 @@ class VoiceAssistantDemo:
         print(f"   Model Size: {stt_stats.get('model_size', 'N/A')}")
         print(f"   Device: {stt_stats.get('device', 'N/A')}")
 
-        print("\n" + "=" * 80)
+        print(f"\n{BANNER}")
         print("✅ Demo completed successfully!".center(80))
-        print("=" * 80 + "\n")
+        print(f"{BANNER}\n")
 
     def run(self):
         """Run the demo"""
@@ -266,8 +270,7 @@ def main():
         return 1
 
     try:
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+        config = load_config(config_path)
     except Exception as e:
         print(f"❌ Failed to load config: {e}")
         return 1
@@ -7,12 +7,13 @@ Test voice input with LLM conversation (text output, no TTS)
 import sys
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
-import yaml
+from config_loader import load_config
 from llm.voice_pipeline import VoicePipeline
 from llm import ConversationManager
 
@@ -25,11 +26,18 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+BANNER = "=" * 70
+RULE = "─" * 70
+
+
+def _header(title):
+    """Print a test section header"""
+    print(f"\n{BANNER}\n{title}\n{BANNER}")
+
+
 def main():
     """Main test function"""
-    print("\n" + "="*70)
-    print("🎤 VOICE + LLM TEST (Text Output Only)")
-    print("="*70)
+    _header("🎤 VOICE + LLM TEST (Text Output Only)")
 
 
     config_path = Path(__file__).parent.parent / 'config' / 'settings.yaml'
@@ -40,8 +48,7 @@ def main():
         return 1
 
     try:
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+        config = load_config(config_path)
         print("✅ Configuration loaded")
     except Exception as e:
         print(f"❌ Failed to load config: {e}")
@@ -52,12 +59,15 @@ def main():
 
     try:
 
-        voice_input = VoicePipeline(config)
-        print("   ✅ Voice input initialized")
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            voice_future = pool.submit(VoicePipeline, config)
+            conversation_future = pool.submit(ConversationManager, config)
 
+            voice_input = voice_future.result()
+            print("   ✅ Voice input initialized")
 
-        conversation_manager = ConversationManager(config)
-        print("   ✅ Conversation manager initialized")
+            conversation_manager = conversation_future.result()
+            print("   ✅ Conversation manager initialized")
 
     except Exception as e:
         print(f"❌ Failed to initialize components: {e}")
@@ -72,13 +82,11 @@ def main():
         print("\n   Continuing with fallback responses...")
 
 
-    print("\n" + "="*70)
-    print("🎤 LISTENING MODE")
-    print("="*70)
+    _header("🎤 LISTENING MODE")
     print("\nSpeak into your microphone...")
     print("(The bot will respond with text only, no speech)")
     print("\nPress Ctrl+C to exit")
-    print("─" * 70)
+    print(RULE)
 
     conversation_count = 0
 
@@ -136,7 +144,7 @@ def main():
                 if metadata.get('fallback'):
                     print("      ⚠️  Using fallback response")
 
-            print("\n" + "─" * 70)
+            print(f"\n{RULE}")
 
     except KeyboardInterrupt:
         print("\n\n⏹️  Stopped by user")
@@ -151,9 +159,7 @@ def main():
         voice_input.cleanup()
 
 
-    print("\n" + "="*70)
-    print("SESSION SUMMARY")
-    print("="*70)
+    _header("SESSION SUMMARY")
 
     summary = conversation_manager.get_conversation_summary()
     print(summary)